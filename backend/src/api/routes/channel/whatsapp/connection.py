@@ -10,6 +10,7 @@ from src.config import settings
 from src.core.logging import log
 from src.db.models.user import User
 from src.db.models.whatsapp_auth import WhatsAppAuth
+from src.tasks.dispatcher import invalidate_baileys_session_cache
 from sqlalchemy import select
 
 router = APIRouter()
@@ -93,6 +94,7 @@ async def connect_whatsapp(
                 if user:
                     user.whatsapp_connected = True
                 await db.commit()
+                invalidate_baileys_session_cache()
 
                 return WhatsAppStatusResponse(
                     status="connected",
@@ -159,6 +161,7 @@ async def get_whatsapp_status(
                 if user:
                     user.whatsapp_connected = True
                 await db.commit()
+                invalidate_baileys_session_cache()
 
             return WhatsAppStatusResponse(
                 status=session_status,
@@ -200,6 +203,7 @@ async def disconnect_whatsapp(
         if user:
             user.whatsapp_connected = False
         await db.commit()
+        invalidate_baileys_session_cache()
 
         return {"success": True, "message": "Disconnected. Reconnect without QR scan."}
 
@@ -21,6 +21,7 @@ from src.db.session import get_db
 from src.db.models.user import User, UserRole
 from src.db.models.whatsapp_auth import WhatsAppAuth
 from src.db.models.dispute import Dispute, DisputeStatus
+from src.tasks.dispatcher import invalidate_baileys_session_cache
 
 router = APIRouter()
 
@@ -220,6 +221,7 @@ async def update_bot_status(baileys_session_id: str, connected: bool, phone_numb
                 log.warning(f"No WhatsAppAuth found for session {baileys_session_id}")
 
             await db.commit()
+            invalidate_baileys_session_cache()
             break
     except Exception as e:
         log.error(f"Failed to update bot status: {e}")
@@ -263,6 +263,28 @@ async def send_intimation(
     return {"success": True, "message": "Intimation dispatch started"}
 
 
+@router.post("/{dispute_id}/ui-ack")
+async def ack_filing_shown(dispute_id: str, user_id: CurrentUserId, db: DBSession):
+    """Tell pending WhatsApp dispatches the UI has shown the filing success.
+
+    Dispatches otherwise wait a few seconds before sending.
+    """
+    result = await db.execute(
+        select(Dispute.id).where(
+            Dispute.id == dispute_id, Dispute.claimant_id == user_id
+        )
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Dispute not found"
+        )
+
+    from src.tasks.dispatcher import signal_ui_ack
+
+    signal_ui_ack(dispute_id)
+    return {"success": True}
+
+
 @router.post("", response_model=DisputeResponse, status_code=status.HTTP_201_CREATED)
 async def create_dispute(
     data: DisputeCreate,
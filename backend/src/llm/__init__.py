@@ -1,6 +1,7 @@
 """LLM client module"""
 
 from src.llm.client import get_llm_client, LLMClient
+from src.llm.parsing import parse_json_reply
 from src.llm.types import LLMResponse, ToolCall
 
-__all__ = ["get_llm_client", "LLMClient", "LLMResponse", "ToolCall"]
+__all__ = ["get_llm_client", "LLMClient", "LLMResponse", "ToolCall", "parse_json_reply"]
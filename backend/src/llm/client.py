@@ -7,6 +7,7 @@ from langchain.chat_models import init_chat_model
 from langchain_core.messages import (
     HumanMessage,
     AIMessage,
+    BaseMessage,
     SystemMessage,
     ToolMessage,
 )
@@ -24,6 +25,10 @@ class LLMClient:
         self.model_name = model or settings.DEFAULT_LLM_MODEL
         self.provider = provider or settings.DEFAULT_LLM_PROVIDER
         self._client: BaseChatModel | None = None
+        # Last converted message list (see _convert_messages)
+        self._converted_source: list[dict[str, Any]] | None = None
+        self._converted_count = 0
+        self._converted: list[BaseMessage] = []
 
     @property
     def client(self) -> BaseChatModel:
@@ -52,40 +57,58 @@ class LLMClient:
         else:
             raise ValueError(f"Unknown provider: {self.provider}")
 
+    def _convert_message(self, msg: dict[str, Any]) -> BaseMessage | None:
+        """Convert a single dict message to a LangChain message object."""
+        role = msg.get("role", "user")
+        content = msg.get("content", "")
+
+        if role == "system":
+            return SystemMessage(content=content)
+        if role == "user":
+            return HumanMessage(content=content)
+        if role == "assistant":
+            if msg.get("tool_calls"):
+                lc_tool_calls = []
+                for tc in msg["tool_calls"]:
+                    if "function" in tc:
+                        lc_tool_calls.append({
+                            "id": tc.get("id", ""),
+                            "name": tc["function"].get("name", ""),
+                            "args": tc["function"].get("arguments", {}),
+                        })
+                    else:
+                        lc_tool_calls.append(tc)
+                return AIMessage(content=content or "", tool_calls=lc_tool_calls)
+            return AIMessage(content=content)
+        if role == "tool":
+            return ToolMessage(
+                content=content,
+                tool_call_id=msg.get("tool_call_id", ""),
+            )
+        return None
+
     def _convert_messages(self, messages: list[dict[str, Any]]) -> list:
-        """Convert dict messages to LangChain message objects."""
-        lc_messages = []
-
-        for msg in messages:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-
-            if role == "system":
-                lc_messages.append(SystemMessage(content=content))
-            elif role == "user":
-                lc_messages.append(HumanMessage(content=content))
-            elif role == "assistant":
-                if msg.get("tool_calls"):
-                    lc_tool_calls = []
-                    for tc in msg["tool_calls"]:
-                        if "function" in tc:
-                            lc_tool_calls.append({
-                                "id": tc.get("id", ""),
-                                "name": tc["function"].get("name", ""),
-                                "args": tc["function"].get("arguments", {}),
-                            })
-                        else:
-                            lc_tool_calls.append(tc)
-                    lc_messages.append(AIMessage(content=content or "", tool_calls=lc_tool_calls))
-                else:
-                    lc_messages.append(AIMessage(content=content))
-            elif role == "tool":
-                lc_messages.append(ToolMessage(
-                    content=content,
-                    tool_call_id=msg.get("tool_call_id", ""),
-                ))
-
-        return lc_messages
+        """Convert dict messages to LangChain message objects.
+
+        The ReAct loop passes the same append-only list on every iteration,
+        so the last conversion is kept and only the new suffix is converted.
+        """
+        if messages is self._converted_source and self._converted_count <= len(messages):
+            start = self._converted_count
+            lc_messages = self._converted
+        else:
+            start = 0
+            lc_messages = []
+
+        for msg in messages[start:]:
+            lc_message = self._convert_message(msg)
+            if lc_message is not None:
+                lc_messages.append(lc_message)
+
+        self._converted_source = messages
+        self._converted_count = len(messages)
+        self._converted = lc_messages
+        return list(lc_messages)
 
     async def chat_completion(
         self,
@@ -0,0 +1,26 @@
+"""Parsing helpers for LLM replies"""
+
+import json
+import re
+from typing import Any
+
+try:
+    # Not a direct dependency (it arrives with langchain's langsmith), so
+    # fall back to the stdlib parser when it is missing
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# JSON object inside an optional ```json fence in an LLM reply
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+def parse_json_reply(content: str | None) -> Any:
+    """Parse the JSON object in an LLM reply, fenced or bare.
+
+    Raises:
+        ValueError: If the reply holds no valid JSON.
+    """
+    content = content or "{}"
+    fenced = _JSON_FENCE.search(content)
+    return _loads(fenced.group(1) if fenced else content.strip())
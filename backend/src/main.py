@@ -1,5 +1,6 @@
 """FastAPI application entry point — ODRMitra"""
 
+import asyncio
 import time
 import uuid
 from contextlib import asynccontextmanager
@@ -14,11 +15,17 @@ from src.core.exceptions import AppException
 from src.api.routes import auth, disputes, documents, chat, voice, admin
 from src.api.routes.channel import router as channel_router
 
+# Settings are static after startup — resolve once instead of per use
+_APP_NAME = settings.APP_NAME
+_API = settings.API_PREFIX
+_DOCS = "/docs" if settings.DEBUG else None
+_REDOC = "/redoc" if settings.DEBUG else None
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    log.info(f"Starting {settings.APP_NAME}...")
+    log.info(f"Starting {_APP_NAME}...")
     setup_logging(debug=settings.DEBUG, log_format=settings.LOG_FORMAT)
     log.info(f"Environment: {settings.current_env}")
 
@@ -32,18 +39,31 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         log.warning(f"Skill sync failed (non-fatal): {e}")
 
+    # Warm up RAG connections so the first search doesn't pay for them
+    try:
+        from src.rag.qdrant_search import QdrantSearch
+        await asyncio.to_thread(QdrantSearch.warmup)
+    except Exception as e:
+        log.warning(f"RAG warmup failed (non-fatal): {e}")
+
     yield
 
     log.info("Shutting down...")
+    from src.rag.index_service import close_http_client
+    await close_http_client()
+    from src.tasks.dispatcher import close_baileys_client
+    await close_baileys_client()
+    from src.rag.qdrant_search import QdrantSearch
+    await QdrantSearch.close()
 
 
 app = FastAPI(
-    title=settings.APP_NAME,
+    title=_APP_NAME,
     description="AI-Enabled Virtual Negotiation Assistant for MSME Disputes",
     version="0.1.0",
     lifespan=lifespan,
-    docs_url="/docs" if settings.DEBUG else None,
-    redoc_url="/redoc" if settings.DEBUG else None,
+    docs_url=_DOCS,
+    redoc_url=_REDOC,
 )
 
 # CORS
@@ -102,26 +122,26 @@ async def generic_exception_handler(request: Request, exc: Exception):
 
 
 # Routes
-app.include_router(auth.router, prefix=f"{settings.API_PREFIX}/auth", tags=["auth"])
-app.include_router(disputes.router, prefix=f"{settings.API_PREFIX}/disputes", tags=["disputes"])
-app.include_router(documents.router, prefix=f"{settings.API_PREFIX}/disputes", tags=["documents"])
-app.include_router(chat.router, prefix=f"{settings.API_PREFIX}/chat", tags=["chat"])
-app.include_router(voice.router, prefix=f"{settings.API_PREFIX}/voice", tags=["voice"])
-app.include_router(channel_router, prefix=f"{settings.API_PREFIX}", tags=["channels"])
-app.include_router(admin.router, prefix=f"{settings.API_PREFIX}/admin", tags=["admin"])
+app.include_router(auth.router, prefix=f"{_API}/auth", tags=["auth"])
+app.include_router(disputes.router, prefix=f"{_API}/disputes", tags=["disputes"])
+app.include_router(documents.router, prefix=f"{_API}/disputes", tags=["documents"])
+app.include_router(chat.router, prefix=f"{_API}/chat", tags=["chat"])
+app.include_router(voice.router, prefix=f"{_API}/voice", tags=["voice"])
+app.include_router(channel_router, prefix=_API, tags=["channels"])
+app.include_router(admin.router, prefix=f"{_API}/admin", tags=["admin"])
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "app": settings.APP_NAME}
+    return {"status": "healthy", "app": _APP_NAME}
 
 
 @app.get("/")
 async def root():
     """Root endpoint."""
     return {
-        "app": settings.APP_NAME,
+        "app": _APP_NAME,
         "version": "0.1.0",
-        "docs": "/docs" if settings.DEBUG else None,
+        "docs": _DOCS,
     }
@@ -1,6 +1,7 @@
 """Text chunking for RAG."""
 
 import re
+from collections.abc import Iterator
 
 from src.core.logging import log
 
@@ -22,13 +23,19 @@ class TextChunker:
 
     def chunk_text(self, text: str, source: str = "") -> list[dict]:
         """Split text into overlapping chunks."""
+        chunks = list(self.iter_chunks(text, source=source))
+        log.info(f"Split text into {len(chunks)} chunks (source={source})")
+        return chunks
+
+    def iter_chunks(self, text: str, source: str = "") -> Iterator[dict]:
+        """Yield overlapping chunks one at a time (see ``chunk_text``)."""
         if not text or not text.strip():
-            return []
+            return
 
         text = self._clean_text(text)
-        chunks = []
         start = 0
         index = 0
+        last_start = 0
 
         while start < len(text):
             end = start + self.chunk_chars
@@ -37,23 +44,21 @@ class TextChunker:
 
             chunk_text = text[start:end].strip()
             if chunk_text:
-                chunks.append({
+                yield {
                     "content": chunk_text,
                     "start_char": start,
                     "end_char": end,
                     "index": index,
                     "source": source,
                     "token_count": self._estimate_tokens(chunk_text),
-                })
+                }
+                last_start = start
                 index += 1
 
             start = end - self.overlap_chars
-            if start <= (chunks[-1]["start_char"] if chunks else 0):
+            if start <= last_start:
                 start = end
 
-        log.info(f"Split text into {len(chunks)} chunks (source={source})")
-        return chunks
-
     def _clean_text(self, text: str) -> str:
         text = re.sub(r'\n{3,}', '\n\n', text)
         text = re.sub(r' {2,}', ' ', text)
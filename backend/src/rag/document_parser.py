@@ -1,17 +1,36 @@
 """Document parser using LlamaParse."""
 
+import io
 import os
+from collections.abc import Iterable
 from pathlib import Path
 
 from src.config import settings
 from src.core.logging import log
 
 
-async def parse_document(file_path: str) -> str:
+def _join_pages(pages: Iterable[str], max_chars: int | None = None) -> str:
+    """Join page texts with blank lines, stopping once ``max_chars`` are collected."""
+    if max_chars is None:
+        return "\n\n".join(pages)
+
+    buf = io.StringIO()
+    for i, page in enumerate(pages):
+        if i:
+            buf.write("\n\n")
+        buf.write(page)
+        if buf.tell() >= max_chars:
+            break
+    return buf.getvalue()[:max_chars]
+
+
+async def parse_document(file_path: str, max_chars: int | None = None) -> str:
     """Parse a document (PDF/image) using LlamaParse.
 
     Args:
         file_path: Path to the file (local path or URL).
+        max_chars: Only keep this many leading characters; pages past the
+            limit are not joined (or, for the pypdf fallback, not extracted).
 
     Returns:
         Parsed text/markdown content.
@@ -19,7 +38,7 @@ async def parse_document(file_path: str) -> str:
     api_key = settings.get("LLAMA_CLOUD_API_KEY", "")
     if not api_key:
         log.warning("LlamaParse API key not configured, falling back to pypdf")
-        return _fallback_parse(file_path)
+        return _fallback_parse(file_path, max_chars)
 
     try:
         from llama_parse import LlamaParse
@@ -35,19 +54,19 @@ async def parse_document(file_path: str) -> str:
 
         if not documents:
             log.warning(f"LlamaParse returned no content for {file_path}")
-            return _fallback_parse(file_path)
+            return _fallback_parse(file_path, max_chars)
 
         # Combine all pages
-        text = "\n\n".join(doc.text for doc in documents if doc.text)
+        text = _join_pages((doc.text for doc in documents if doc.text), max_chars)
         log.info(f"Parsed {file_path}: {len(text)} chars via LlamaParse")
         return text
 
     except Exception as e:
         log.error(f"LlamaParse failed for {file_path}: {e}")
-        return _fallback_parse(file_path)
+        return _fallback_parse(file_path, max_chars)
 
 
-def _fallback_parse(file_path: str) -> str:
+def _fallback_parse(file_path: str, max_chars: int | None = None) -> str:
     """Fallback PDF parser using pypdf."""
     try:
         from pypdf import PdfReader
@@ -56,8 +75,8 @@ def _fallback_parse(file_path: str) -> str:
             return f"[File not found: {file_path}]"
 
         reader = PdfReader(file_path)
-        text = "\n\n".join(
-            page.extract_text() or "" for page in reader.pages
+        text = _join_pages(
+            (page.extract_text() or "" for page in reader.pages), max_chars
         )
         log.info(f"Parsed {file_path}: {len(text)} chars via pypdf fallback")
         return text
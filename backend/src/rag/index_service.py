@@ -3,6 +3,8 @@
 import asyncio
 import traceback
 import tempfile
+from collections.abc import Iterator
+from itertools import batched
 from pathlib import Path
 
 import httpx
@@ -13,25 +15,110 @@ from src.rag.qdrant_search import QdrantSearch, LEGAL_COLLECTION, CASE_DOCS_COLL
 from src.rag.chunker import TextChunker
 from src.rag.document_parser import parse_document
 
+# Shared download client — reuses pooled connections across documents
+_HTTP_CLIENT: httpx.AsyncClient | None = None
+
+# In-flight fire_and_forget tasks
+_background_tasks: set[asyncio.Task] = set()
+
+# Chunker settings are fixed, and TextChunker holds no per-document state
+_CHUNKER = TextChunker(chunk_size=400, chunk_overlap=50)
+
+# Chunks embedded and upserted per window, so only one window is held in memory
+EMBED_BATCH = 64
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Lazily create the shared download client."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=120,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+    return _HTTP_CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared download client (called on app shutdown)."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
 
 async def _download_file(url: str) -> str:
-    """Download a file from URL to a temporary path and return the path."""
+    """Download a file from URL to a temporary path and return the path.
+
+    The body is streamed to disk in 64 KiB pieces rather than buffered whole
+    in memory. The temp file lands in $TMPDIR (tempfile's default lookup).
+    """
     log.info(f"[INDEX] Downloading file from: {url[:100]}...")
-    async with httpx.AsyncClient(timeout=120, follow_redirects=True) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
 
     suffix = ".pdf"
     if ".doc" in url.lower():
         suffix = ".docx"
 
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-    tmp.write(resp.content)
-    tmp.close()
-    log.info(f"[INDEX] Downloaded {len(resp.content)} bytes to {tmp.name}")
+    size = 0
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        try:
+            async with _get_http_client().stream("GET", url) as resp:
+                resp.raise_for_status()
+                async for chunk in resp.aiter_bytes(65536):
+                    tmp.write(chunk)
+                    size += len(chunk)
+        except Exception:
+            tmp.close()
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+
+    log.info(f"[INDEX] Downloaded {size} bytes to {tmp.name}")
     return tmp.name
 
 
+async def _index_in_windows(
+    chunks: Iterator[dict],
+    source: str,
+    collection_name: str,
+    extra_payload: dict,
+) -> int:
+    """Embed and upsert chunks window by window; returns the chunk count.
+
+    Two stages joined by a small bounded queue: while one window is being
+    upserted, the next is already being embedded.
+    """
+    queue: asyncio.Queue[list | None] = asyncio.Queue(maxsize=4)
+    count = 0
+
+    async def embed_stage() -> None:
+        for window in batched(chunks, EMBED_BATCH):
+            points = await asyncio.to_thread(
+                QdrantSearch.build_points, list(window), source, extra_payload
+            )
+            await queue.put(points)
+        await queue.put(None)
+
+    async def upsert_stage() -> None:
+        nonlocal count
+        while (points := await queue.get()) is not None:
+            await QdrantSearch.upsert_points_async(points, collection_name)
+            count += len(points)
+
+    await asyncio.to_thread(QdrantSearch.ensure_collection, collection_name)
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(embed_stage())
+            tg.create_task(upsert_stage())
+    except ExceptionGroup as eg:
+        # Surface the first stage's error for index_error, chained to the
+        # group so a second failing stage still shows in the traceback
+        raise eg.exceptions[0] from eg
+
+    log.info(f"Indexed {count} chunks from {source} into {collection_name}")
+    return count
+
+
 def fire_and_forget(coro):
     """Launch an async coroutine as a fire-and-forget task with error logging."""
     async def _wrapper():
@@ -41,8 +128,11 @@ def fire_and_forget(coro):
             log.error(f"[INDEX] Background task failed: {e}")
             log.error(f"[INDEX] Traceback: {traceback.format_exc()}")
 
-    loop = asyncio.get_event_loop()
-    loop.create_task(_wrapper())
+    # Keep a strong reference — the loop only holds weak ones, so an
+    # unreferenced task can be garbage-collected mid-flight.
+    task = asyncio.create_task(_wrapper())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
 
 async def index_knowledge_document(doc_id: str) -> None:
@@ -80,27 +170,23 @@ async def index_knowledge_document(doc_id: str) -> None:
                 if not text or text.startswith("["):
                     raise ValueError(f"Failed to parse document: {text[:200]}")
 
-                # Chunk
-                chunker = TextChunker(chunk_size=400, chunk_overlap=50)
-                chunks = chunker.chunk_text(text, source=doc.original_filename)
-                log.info(f"[INDEX] Generated {len(chunks)} chunks")
-
-                if not chunks:
-                    raise ValueError("No chunks generated from document")
-
-                # Delete existing chunks for this source (in case of re-index)
-                QdrantSearch.delete_by_source(
-                    doc.original_filename,
-                    collection_name=LEGAL_COLLECTION,
-                )
-
-                # Index into Qdrant
-                count = QdrantSearch.index_chunks(
-                    chunks,
+                # Chunk + index into Qdrant, one window at a time. Point IDs are
+                # deterministic, so a re-index overwrites the previous chunks.
+                count = await _index_in_windows(
+                    _CHUNKER.iter_chunks(text, source=doc.original_filename),
                     source=doc.original_filename,
                     collection_name=LEGAL_COLLECTION,
                     extra_payload={"doc_id": str(doc.id)},
                 )
+                log.info(f"[INDEX] Generated {count} chunks")
+
+                if not count:
+                    raise ValueError("No chunks generated from document")
+
+                # Remove leftovers from a longer previous version
+                await asyncio.to_thread(
+                    QdrantSearch.delete_stale_chunks, LEGAL_COLLECTION, str(doc.id), count
+                )
 
                 # Update status
                 doc.index_status = IndexStatus.INDEXED.value
@@ -151,19 +237,8 @@ async def index_case_document(doc_id: str, dispute_id: str) -> None:
                 if not text or text.startswith("["):
                     raise ValueError(f"Failed to parse document: {text[:200]}")
 
-                chunker = TextChunker(chunk_size=400, chunk_overlap=50)
-                chunks = chunker.chunk_text(text, source=doc.original_filename)
-
-                if not chunks:
-                    raise ValueError("No chunks generated from document")
-
-                QdrantSearch.delete_by_filter(
-                    CASE_DOCS_COLLECTION,
-                    {"doc_id": str(doc.id)},
-                )
-
-                count = QdrantSearch.index_chunks(
-                    chunks,
+                count = await _index_in_windows(
+                    _CHUNKER.iter_chunks(text, source=doc.original_filename),
                     source=doc.original_filename,
                     collection_name=CASE_DOCS_COLLECTION,
                     extra_payload={
@@ -173,6 +248,12 @@ async def index_case_document(doc_id: str, dispute_id: str) -> None:
                         "uploaded_by": str(doc.uploaded_by),
                     },
                 )
+                if not count:
+                    raise ValueError("No chunks generated from document")
+
+                await asyncio.to_thread(
+                    QdrantSearch.delete_stale_chunks, CASE_DOCS_COLLECTION, str(doc.id), count
+                )
 
                 doc.index_status = "indexed"
                 await db.commit()
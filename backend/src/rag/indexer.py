@@ -1,6 +1,9 @@
 """Index legal documents into Qdrant."""
 
+import asyncio
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from src.core.logging import log
@@ -8,10 +11,55 @@ from src.rag.chunker import TextChunker
 from src.rag.qdrant_search import QdrantSearch
 from src.rag.document_parser import parse_document_sync
 
-
-def index_legal_documents(docs_dir: str | Path) -> dict:
+_CHUNKER = TextChunker(chunk_size=500, chunk_overlap=75)
+
+# Files embedded + uploaded at the same time
+_UPLOAD_CONCURRENCY = 4
+
+
+async def _index_file(
+    pdf_path: Path,
+    upload_slots: asyncio.Semaphore,
+    parse_pool: ProcessPoolExecutor,
+) -> dict | None:
+    """Parse, chunk and index one PDF; returns its stats entry (None if skipped)."""
+    source_name = pdf_path.stem
+    log.info(f"Parsing: {pdf_path.name}")
+
+    try:
+        # pypdf parsing is CPU-bound — run it in another process, not a thread
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(parse_pool, parse_document_sync, str(pdf_path))
+        if not text or len(text) < 50:
+            log.warning(f"Skipping {pdf_path.name}: too little text ({len(text)} chars)")
+            return None
+
+        chunks = _CHUNKER.chunk_text(text, source=source_name)
+        if not chunks:
+            log.warning(f"Skipping {pdf_path.name}: no chunks generated")
+            return None
+
+        # Files already upload side by side, so each one uses a single
+        # upload worker rather than a process pool of its own
+        async with upload_slots:
+            count = await asyncio.to_thread(
+                QdrantSearch.index_chunks, chunks, source=source_name, parallel=1
+            )
+        log.info(f"Indexed {pdf_path.name}: {count} chunks, {len(text)} chars")
+        return {"file": pdf_path.name, "chunks": count, "chars": len(text)}
+
+    except Exception as e:
+        log.error(f"Failed to index {pdf_path.name}: {e}")
+        return {"file": pdf_path.name, "chunks": 0, "error": str(e)}
+
+
+async def index_legal_documents(docs_dir: str | Path) -> dict:
     """Index all PDFs from the rag-index directory into Qdrant.
 
+    Files are processed concurrently: each one is parsed in a worker
+    process, then chunked and uploaded in its own task. Embedding and
+    upload stay in this process.
+
     Args:
         docs_dir: Path to directory containing PDFs.
 
@@ -23,36 +71,25 @@ def index_legal_documents(docs_dir: str | Path) -> dict:
         log.error(f"Documents directory not found: {docs_dir}")
         return {"error": "Directory not found"}
 
-    chunker = TextChunker(chunk_size=500, chunk_overlap=75)
-    total_chunks = 0
-    indexed_files = []
+    upload_slots = asyncio.Semaphore(_UPLOAD_CONCURRENCY)
 
     pdf_files = list(docs_dir.glob("*.pdf"))
     log.info(f"Found {len(pdf_files)} PDFs to index in {docs_dir}")
 
-    for pdf_path in pdf_files:
-        source_name = pdf_path.stem
-        log.info(f"Parsing: {pdf_path.name}")
-
-        try:
-            text = parse_document_sync(str(pdf_path))
-            if not text or len(text) < 50:
-                log.warning(f"Skipping {pdf_path.name}: too little text ({len(text)} chars)")
-                continue
-
-            chunks = chunker.chunk_text(text, source=source_name)
-            if not chunks:
-                log.warning(f"Skipping {pdf_path.name}: no chunks generated")
-                continue
-
-            count = QdrantSearch.index_chunks(chunks, source=source_name)
-            total_chunks += count
-            indexed_files.append({"file": pdf_path.name, "chunks": count, "chars": len(text)})
-            log.info(f"Indexed {pdf_path.name}: {count} chunks, {len(text)} chars")
-
-        except Exception as e:
-            log.error(f"Failed to index {pdf_path.name}: {e}")
-            indexed_files.append({"file": pdf_path.name, "chunks": 0, "error": str(e)})
+    # Defer HNSW graph building until every file is uploaded
+    QdrantSearch.ensure_collection(bulk_mode=True)
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as parse_pool:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(_index_file(pdf_path, upload_slots, parse_pool))
+                    for pdf_path in pdf_files
+                ]
+    finally:
+        QdrantSearch.finalize_bulk()
+
+    indexed_files = [t.result() for t in tasks if t.result() is not None]
+    total_chunks = sum(f["chunks"] for f in indexed_files)
 
     result = {
         "total_files": len(pdf_files),
@@ -74,7 +111,7 @@ if __name__ == "__main__":
     from src.core.logging import setup_logging
     setup_logging(debug=True)
 
-    result = index_legal_documents(docs_dir)
+    result = asyncio.run(index_legal_documents(docs_dir))
     print(f"\nIndexing Results:")
     for f in result.get("files", []):
         status = f"✓ {f['chunks']} chunks" if f.get("chunks") else f"✗ {f.get('error', 'no content')}"
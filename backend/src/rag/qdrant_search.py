@@ -1,10 +1,12 @@
 """Qdrant RAG Search — multi-collection support for ODRMitra."""
 
+from functools import lru_cache
 from typing import Optional
+import hashlib
 import uuid
 
 import httpx
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.models import Distance, VectorParams, PointStruct
 
@@ -17,7 +19,73 @@ LEGAL_COLLECTION = settings.get("QDRANT_COLLECTION", "odrmitra_legal")
 CASE_DOCS_COLLECTION = "odrmitra_case_docs"
 
 # OpenRouter accepts up to a few thousand inputs per call; stay conservative.
-_EMBED_BATCH_SIZE = 64
+_EMBED_BATCH_SIZE = int(settings.get("EMBEDDING_BATCH_SIZE", 64))
+
+# Minimum cosine score for a search hit (text-embedding-3-small cosine scores
+# run lower than MiniLM's did — relevant hits commonly land around 0.25-0.5)
+_SCORE_THRESHOLD = float(settings.get("SEARCH_SCORE_THRESHOLD", 0.2))
+
+# Points per request when index_chunks uploads through the sync client
+_UPLOAD_BATCH_SIZE = 128
+
+# int8 scalar quantization kept in RAM (~4x smaller than float32); searches
+# rescore the oversampled candidates against the original vectors.
+_QUANTIZATION = models.ScalarQuantization(
+    scalar=models.ScalarQuantizationConfig(
+        type=models.ScalarType.INT8,
+        quantile=0.99,
+        always_ram=True,
+    ),
+)
+_QUANTIZATION_SEARCH = models.QuantizationSearchParams(ignore=False, rescore=True, oversampling=2.0)
+
+# Stands in for an unset indexing_threshold when restoring after a bulk
+# upload (a None in the update would leave the bulk value of 0 in place)
+_DEFAULT_INDEXING_THRESHOLD = 20000
+
+# HNSW beam width per search: a small first pass (the rescoring above
+# restores precision), widened for large limits so recall holds
+_MIN_HNSW_EF = 64
+
+
+@lru_cache(maxsize=32)
+def _search_params(limit: int) -> models.SearchParams:
+    """Search params for a result limit (few distinct limits, so cached)."""
+    return models.SearchParams(
+        hnsw_ef=max(_MIN_HNSW_EF, 4 * limit),
+        quantization=_QUANTIZATION_SEARCH,
+    )
+
+
+# Base search filter — every indexed point has type=document
+_TYPE_DOCUMENT_COND = models.FieldCondition(key="type", match=models.MatchValue(value="document"))
+_DOCUMENT_FILTER = models.Filter(must=[_TYPE_DOCUMENT_COND])
+
+# Payload fields search results actually use — skip dispute_id, doc_type, etc.
+_SEARCH_PAYLOAD = models.PayloadSelectorInclude(include=["content", "source", "chunk_index"])
+
+
+@lru_cache(maxsize=128)
+def _query_filter(source_filter: str | None, filter_items: tuple) -> models.Filter:
+    """Search filter for an optional source and extra (key, value) matches.
+
+    Cached, so repeated searches for the same dispute or source reuse one
+    Filter object instead of rebuilding its conditions every call.
+    """
+    if not source_filter and not filter_items:
+        return _DOCUMENT_FILTER
+
+    must_conditions = [_TYPE_DOCUMENT_COND]
+    if source_filter:
+        must_conditions.append(
+            models.FieldCondition(key="source", match=models.MatchValue(value=source_filter))
+        )
+    # Additional filters (e.g. dispute_id)
+    for key, value in filter_items:
+        must_conditions.append(
+            models.FieldCondition(key=key, match=models.MatchValue(value=value))
+        )
+    return models.Filter(must=must_conditions)
 
 
 class QdrantSearch:
@@ -28,9 +96,15 @@ class QdrantSearch:
     """
 
     _client: Optional[QdrantClient] = None
+    _async_client: Optional[AsyncQdrantClient] = None
+    _http_client: Optional[httpx.Client] = None
     _collections_initialized: set[str] = set()
+    # Index settings to put back in finalize_bulk, per collection in bulk mode
+    _bulk_restore: dict[str, tuple[models.HnswConfigDiff, models.OptimizersConfigDiff]] = {}
 
     QDRANT_URL = settings.get("QDRANT_URL", "http://localhost:6333")
+    QDRANT_PREFER_GRPC = settings.get("QDRANT_PREFER_GRPC", True)
+    QDRANT_GRPC_PORT = settings.get("QDRANT_GRPC_PORT", 6334)
     EMBEDDING_MODEL = settings.get("EMBEDDING_MODEL", "openai/text-embedding-3-small")
     EMBEDDING_DIMENSION = settings.get("EMBEDDING_DIMENSION", 1536)
     OPENROUTER_BASE_URL = settings.get("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
@@ -38,10 +112,62 @@ class QdrantSearch:
     @classmethod
     def get_client(cls) -> QdrantClient:
         if cls._client is None:
-            cls._client = QdrantClient(url=cls.QDRANT_URL)
+            cls._client = QdrantClient(
+                url=cls.QDRANT_URL,
+                prefer_grpc=cls.QDRANT_PREFER_GRPC,
+                grpc_port=cls.QDRANT_GRPC_PORT,
+            )
             log.info(f"Connected to Qdrant at {cls.QDRANT_URL}")
         return cls._client
 
+    @classmethod
+    def get_async_client(cls) -> AsyncQdrantClient:
+        if cls._async_client is None:
+            cls._async_client = AsyncQdrantClient(
+                url=cls.QDRANT_URL,
+                prefer_grpc=cls.QDRANT_PREFER_GRPC,
+                grpc_port=cls.QDRANT_GRPC_PORT,
+            )
+        return cls._async_client
+
+    @classmethod
+    def get_http_client(cls) -> httpx.Client:
+        """Pooled HTTP client for the embeddings API (keeps TLS connections warm)."""
+        if cls._http_client is None:
+            cls._http_client = httpx.Client(
+                base_url=cls.OPENROUTER_BASE_URL,
+                timeout=60.0,
+            )
+        return cls._http_client
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the pooled Qdrant and embeddings clients (called on app shutdown)."""
+        if cls._http_client is not None:
+            cls._http_client.close()
+            cls._http_client = None
+        if cls._async_client is not None:
+            await cls._async_client.close()
+            cls._async_client = None
+        if cls._client is not None:
+            cls._client.close()
+            cls._client = None
+
+    @classmethod
+    def warmup(cls) -> None:
+        """Open Qdrant + embeddings connections ahead of the first request.
+
+        Creates the clients, checks both collections and opens a TLS
+        connection to the embeddings host with a HEAD request (nothing is
+        embedded, so startup doesn't cost an API call), so the first
+        search/index after a deploy doesn't pay connection setup and
+        collection checks.
+        """
+        for collection_name in (LEGAL_COLLECTION, CASE_DOCS_COLLECTION):
+            cls.ensure_collection(collection_name)
+        cls.get_http_client().head("/models")
+        log.info("QdrantSearch warmed up")
+
     @classmethod
     def embed_texts(cls, texts: list[str]) -> list[list[float]]:
         """Embed texts via OpenRouter. Returns vectors in input order."""
@@ -49,17 +175,17 @@ class QdrantSearch:
         if not api_key:
             raise RuntimeError("OPENROUTER_API_KEY is not configured")
 
+        http = cls.get_http_client()
         vectors: list[list[float]] = []
         for start in range(0, len(texts), _EMBED_BATCH_SIZE):
             batch = texts[start:start + _EMBED_BATCH_SIZE]
-            resp = httpx.post(
-                f"{cls.OPENROUTER_BASE_URL}/embeddings",
+            resp = http.post(
+                "/embeddings",
                 headers={
                     "Authorization": f"Bearer {api_key}",
                     "Content-Type": "application/json",
                 },
                 json={"model": cls.EMBEDDING_MODEL, "input": batch},
-                timeout=60.0,
             )
             resp.raise_for_status()
             data = resp.json()["data"]
@@ -69,15 +195,35 @@ class QdrantSearch:
         return vectors
 
     @classmethod
-    def ensure_collection(cls, collection_name: str = LEGAL_COLLECTION) -> str:
-        """Ensure the collection exists, creating it if needed."""
-        if collection_name in cls._collections_initialized:
+    def embed_query(cls, query: str) -> list[float]:
+        """Embed a search query, reusing the vector for repeated queries."""
+        return list(_cached_query_vector(query))
+
+    @classmethod
+    def ensure_collection(
+        cls,
+        collection_name: str = LEGAL_COLLECTION,
+        bulk_mode: bool = False,
+    ) -> str:
+        """Ensure the collection exists, creating it if needed.
+
+        With ``bulk_mode`` a newly created collection starts with the HNSW
+        index build switched off, so a large upload isn't slowed down by
+        concurrent graph construction; call ``finalize_bulk`` afterwards to
+        restore its settings. An existing collection is left as is: dropping
+        its graph would turn every live search into a full scan until the
+        rebuild finished.
+        """
+        if collection_name in cls._collections_initialized and not bulk_mode:
             return collection_name
 
         client = cls.get_client()
         collections = client.get_collections().collections
         exists = any(c.name == collection_name for c in collections)
 
+        if exists and bulk_mode:
+            log.info(f"Qdrant collection {collection_name} already exists; bulk mode skipped")
+
         if not exists:
             client.create_collection(
                 collection_name=collection_name,
@@ -85,9 +231,29 @@ class QdrantSearch:
                     size=cls.EMBEDDING_DIMENSION,
                     distance=Distance.COSINE,
                 ),
+                quantization_config=_QUANTIZATION,
             )
             log.info(f"Created Qdrant collection: {collection_name}")
 
+            if bulk_mode:
+                config = client.get_collection(collection_name).config
+                indexing_threshold = config.optimizer_config.indexing_threshold
+                cls._bulk_restore[collection_name] = (
+                    models.HnswConfigDiff(m=config.hnsw_config.m),
+                    models.OptimizersConfigDiff(
+                        indexing_threshold=(
+                            _DEFAULT_INDEXING_THRESHOLD
+                            if indexing_threshold is None else indexing_threshold
+                        ),
+                    ),
+                )
+                client.update_collection(
+                    collection_name=collection_name,
+                    optimizers_config=models.OptimizersConfigDiff(indexing_threshold=0),
+                    hnsw_config=models.HnswConfigDiff(m=0),
+                )
+                log.info(f"Bulk mode enabled for Qdrant collection: {collection_name}")
+
             # Common payload indexes
             for field in ["source", "type"]:
                 client.create_payload_index(
@@ -103,33 +269,67 @@ class QdrantSearch:
                     field_name="dispute_id",
                     field_schema=models.PayloadSchemaType.KEYWORD,
                 )
-                client.create_payload_index(
-                    collection_name=collection_name,
-                    field_name="doc_id",
-                    field_schema=models.PayloadSchemaType.KEYWORD,
-                )
+
+        # Every collection is re-indexed / deleted by doc_id; without a payload
+        # index those filters scan the whole collection. Older collections
+        # were created without it on the legal side, so backfill it here.
+        if not exists or "doc_id" not in (client.get_collection(collection_name).payload_schema or {}):
+            client.create_payload_index(
+                collection_name=collection_name,
+                field_name="doc_id",
+                field_schema=models.PayloadSchemaType.KEYWORD,
+            )
 
         cls._collections_initialized.add(collection_name)
         return collection_name
 
     @classmethod
-    def index_chunks(
+    def finalize_bulk(cls, collection_name: str = LEGAL_COLLECTION) -> None:
+        """Restore the index settings ``ensure_collection`` replaced for a bulk upload."""
+        restore = cls._bulk_restore.pop(collection_name, None)
+        if restore is None:
+            return  # bulk mode was never enabled for this collection
+
+        hnsw_config, optimizers_config = restore
+        cls.get_client().update_collection(
+            collection_name=collection_name,
+            optimizers_config=optimizers_config,
+            hnsw_config=hnsw_config,
+        )
+        log.info(f"Bulk mode finalized for Qdrant collection: {collection_name}")
+
+    @staticmethod
+    def point_id(owner: str, chunk_index: int) -> str:
+        """Deterministic point ID, so re-indexing a document overwrites in place."""
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{owner}:{chunk_index}"))
+
+    @classmethod
+    def build_points(
         cls,
         chunks: list[dict],
         source: str = "",
-        collection_name: str = LEGAL_COLLECTION,
         extra_payload: dict | None = None,
-    ) -> int:
-        """Index text chunks into a Qdrant collection."""
-        client = cls.get_client()
-        cls.ensure_collection(collection_name)
-
-        contents = [chunk["content"] for chunk in chunks]
-        embeddings = cls.embed_texts(contents) if contents else []
+    ) -> list[PointStruct]:
+        """Embed chunks and wrap them as Qdrant points.
+
+        Repeated chunk texts (page headers, boilerplate) are embedded once and
+        their vector shared by every point carrying that text.
+        """
+        unique_index: dict[bytes, int] = {}
+        unique_contents: list[str] = []
+        slots: list[int] = []
+        for chunk in chunks:
+            key = hashlib.blake2b(chunk["content"].encode(), digest_size=16).digest()
+            if key not in unique_index:
+                unique_index[key] = len(unique_contents)
+                unique_contents.append(chunk["content"])
+            slots.append(unique_index[key])
+        unique_embeddings = cls.embed_texts(unique_contents) if unique_contents else []
 
         points = []
-        for chunk, embedding in zip(chunks, embeddings):
+        for chunk, slot in zip(chunks, slots):
             content = chunk["content"]
+            embedding = unique_embeddings[slot]
 
             payload = {
                 "content": content,
@@ -140,73 +340,98 @@ class QdrantSearch:
             if extra_payload:
                 payload.update(extra_payload)
 
-            point_id = str(uuid.uuid4())
+            owner = payload.get("doc_id") or payload["source"]
+            point_id = cls.point_id(owner, payload["chunk_index"])
             points.append(PointStruct(
                 id=point_id,
                 vector=embedding,
                 payload=payload,
             ))
+        return points
+
+    @classmethod
+    def index_chunks(
+        cls,
+        chunks: list[dict],
+        source: str = "",
+        collection_name: str = LEGAL_COLLECTION,
+        extra_payload: dict | None = None,
+        parallel: int = 4,
+    ) -> int:
+        """Index text chunks into a Qdrant collection.
+
+        ``parallel`` is the number of upload worker processes; callers that
+        already index several documents at once should pass 1.
+        """
+        client = cls.get_client()
+        cls.ensure_collection(collection_name)
+
+        points = cls.build_points(chunks, source, extra_payload)
 
         if points:
-            # Batch upsert in groups of 100
-            for i in range(0, len(points), 100):
-                batch = points[i:i + 100]
-                client.upsert(collection_name=collection_name, points=batch)
+            # The client splits into batches and uploads them from parallel
+            # workers without waiting for Qdrant to apply them. The last batch
+            # is upserted with wait=True: Qdrant applies a collection's updates
+            # in order, so once it returns every chunk here is searchable.
+            head, tail = points[:-_UPLOAD_BATCH_SIZE], points[-_UPLOAD_BATCH_SIZE:]
+            if head:
+                client.upload_points(
+                    collection_name=collection_name,
+                    points=head,
+                    batch_size=_UPLOAD_BATCH_SIZE,
+                    parallel=parallel,
+                    wait=False,
+                )
+            client.upsert(collection_name=collection_name, points=tail, wait=True)
 
             log.info(f"Indexed {len(points)} chunks from {source} into {collection_name}")
 
         return len(points)
 
+    @classmethod
+    async def upsert_points_async(cls, points: list[PointStruct], collection_name: str) -> None:
+        """Upsert one window of points through the async client.
+
+        Indexing windows are small enough for a single request; the caller
+        overlaps each upsert with embedding the next window.
+        """
+        await cls.get_async_client().upsert(collection_name=collection_name, points=points)
+
     @classmethod
     def search(
         cls,
         query: str,
         collection_name: str = LEGAL_COLLECTION,
         limit: int = 5,
-        # text-embedding-3-small cosine scores run lower than MiniLM's did —
-        # relevant hits commonly land around 0.25-0.5.
-        score_threshold: float = 0.2,
+        score_threshold: float = _SCORE_THRESHOLD,
         source_filter: str | None = None,
         filters: dict | None = None,
+        query_vector: list[float] | None = None,
+        raise_errors: bool = False,
     ) -> list[dict]:
-        """Search for relevant document chunks in a specific collection."""
+        """Search for relevant document chunks in a specific collection.
+
+        Pass ``query_vector`` when the query is already embedded, e.g. when
+        searching several collections with the same query. Errors are logged
+        and reported as no hits unless ``raise_errors`` is set.
+        """
         client = cls.get_client()
         cls.ensure_collection(collection_name)
 
         try:
-            query_vector = cls.embed_texts([query])[0]
-
-            must_conditions = [
-                models.FieldCondition(
-                    key="type",
-                    match=models.MatchValue(value="document"),
-                ),
-            ]
-            if source_filter:
-                must_conditions.append(
-                    models.FieldCondition(
-                        key="source",
-                        match=models.MatchValue(value=source_filter),
-                    )
-                )
-
-            # Apply additional filters (e.g. dispute_id)
-            if filters:
-                for key, value in filters.items():
-                    must_conditions.append(
-                        models.FieldCondition(
-                            key=key,
-                            match=models.MatchValue(value=value),
-                        )
-                    )
+            if query_vector is None:
+                query_vector = cls.embed_query(query)
 
             results = client.query_points(
                 collection_name=collection_name,
                 query=query_vector,
                 limit=limit,
                 score_threshold=score_threshold,
-                query_filter=models.Filter(must=must_conditions),
-                with_payload=True,
+                query_filter=_query_filter(
+                    source_filter, tuple(filters.items()) if filters else (),
+                ),
+                search_params=_search_params(limit),
+                with_payload=_SEARCH_PAYLOAD,
             ).points
 
             return [
@@ -222,6 +447,8 @@ class QdrantSearch:
 
         except Exception as e:
             log.error(f"Search error in {collection_name}: {e}")
+            if raise_errors:
+                raise
             return []
 
     @classmethod
@@ -310,6 +537,42 @@ class QdrantSearch:
             log.error(f"Delete by filter failed: {e}")
             return 0
 
+    @classmethod
+    def delete_stale_chunks(cls, collection_name: str, doc_id: str, chunk_count: int) -> int:
+        """After a re-index, drop the document's points not rewritten by it.
+
+        Points 0..chunk_count-1 were just upserted under their deterministic
+        IDs; anything else tagged with this doc_id (a longer previous version,
+        or points from before IDs were deterministic) is stale.
+        """
+        client = cls.get_client()
+        cls.ensure_collection(collection_name)
+
+        try:
+            client.delete(
+                collection_name=collection_name,
+                points_selector=models.FilterSelector(
+                    filter=models.Filter(
+                        must=[
+                            models.FieldCondition(
+                                key="doc_id",
+                                match=models.MatchValue(value=doc_id),
+                            )
+                        ],
+                        must_not=[
+                            models.HasIdCondition(
+                                has_id=[cls.point_id(doc_id, i) for i in range(chunk_count)],
+                            )
+                        ],
+                    )
+                ),
+            )
+            log.info(f"Deleted stale chunks for doc_id={doc_id} from {collection_name}")
+            return 1
+        except Exception as e:
+            log.error(f"Delete stale chunks failed: {e}")
+            return 0
+
     @classmethod
     def get_collection_info(cls, collection_name: str = LEGAL_COLLECTION) -> dict:
         """Get collection statistics."""
@@ -325,3 +588,9 @@ class QdrantSearch:
             }
         except Exception:
             return {"name": collection_name, "vectors_count": 0, "points_count": 0}
+
+
+@lru_cache(maxsize=256)
+def _cached_query_vector(query: str) -> tuple[float, ...]:
+    """Query embedding cache (~50 KB per 1536-dim entry, so kept small)."""
+    return tuple(QdrantSearch.embed_texts([query])[0])
@@ -8,27 +8,47 @@ import re
 
 SKILLS_DIR = Path(__file__).parent / "builtin"
 
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+
+# libyaml-backed loader when available (much faster than the pure-Python one)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class SkillLoader:
     """Load skills from file-based SKILL.md definitions."""
 
     _skills_cache: dict[str, dict] | None = None
+    # path -> (mtime_ns, parsed skill); unchanged files skip re-parsing
+    _parse_cache: dict[str, tuple[int, dict[str, Any] | None]] = {}
 
     @classmethod
     def _parse_skill_md(cls, skill_path: Path) -> dict[str, Any] | None:
         """Parse a SKILL.md file and return skill definition."""
         skill_file = skill_path / "SKILL.md"
-        if not skill_file.exists():
+        try:
+            mtime_ns = skill_file.stat().st_mtime_ns
+        except FileNotFoundError:
             return None
 
+        cached = cls._parse_cache.get(str(skill_file))
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        skill = cls._parse_skill_file(skill_path, skill_file)
+        cls._parse_cache[str(skill_file)] = (mtime_ns, skill)
+        return skill
+
+    @classmethod
+    def _parse_skill_file(cls, skill_path: Path, skill_file: Path) -> dict[str, Any] | None:
+        """Read and parse SKILL.md frontmatter + body."""
         content = skill_file.read_text(encoding="utf-8")
 
-        frontmatter_match = re.match(r"^---\s*\n(.*?)\n---\s*\n(.*)$", content, re.DOTALL)
+        frontmatter_match = _FRONTMATTER_RE.match(content)
         if not frontmatter_match:
             return None
 
         try:
-            frontmatter = yaml.safe_load(frontmatter_match.group(1))
+            frontmatter = yaml.load(frontmatter_match.group(1), Loader=_YamlLoader)
         except yaml.YAMLError:
             return None
 
@@ -20,11 +20,14 @@ async def sync_skills_to_db(db: AsyncSession) -> dict:
     created = 0
     updated = 0
 
+    result = await db.execute(
+        select(Skill).where(Skill.slug.in_(list(file_skills)))
+    )
+    existing_map = {s.slug: s for s in result.scalars().all()}
+
+    new_skills = []
     for slug, skill_data in file_skills.items():
-        result = await db.execute(
-            select(Skill).where(Skill.slug == slug)
-        )
-        existing = result.scalar_one_or_none()
+        existing = existing_map.get(slug)
 
         if existing:
             existing.name = skill_data["name"]
@@ -47,9 +50,10 @@ async def sync_skills_to_db(db: AsyncSession) -> dict:
                 is_active=True,
                 is_featured=skill_data.get("is_featured", False),
             )
-            db.add(skill)
+            new_skills.append(skill)
             created += 1
 
+    db.add_all(new_skills)
     await db.commit()
 
     result = {"created": created, "updated": updated, "total": len(file_skills)}
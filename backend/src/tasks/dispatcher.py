@@ -5,13 +5,105 @@ Handles the Voice → WhatsApp → Case Processing pipeline.
 """
 
 import asyncio
+import time
+import traceback
+import uuid
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+
+import httpx
+from sqlalchemy import select, update
+from sqlalchemy.orm import joinedload
+
 from src.core.logging import log
 from src.config import settings
+from src.db.models.dispute import Dispute, DisputeStatus
+from src.db.models.user import User
+from src.db.models.whatsapp_auth import WhatsAppAuth
+from src.db.session import async_session_factory
+
+# Read once at import; these don't change while the app is running
+_BAILEYS_URL = settings.get("baileys_service_url", "http://127.0.0.1:3001")
+_BAILEYS_API_KEY = settings.get("baileys_api_key", "baileys-secret-key")
+_SOD_RESPONSE_DAYS = int(settings.get("sod_response_days", 15))
+
+# Shared Baileys client — pooled keep-alive connections instead of a new
+# TCP handshake per outbound message. Closed from the app lifespan.
+_baileys_client: httpx.AsyncClient | None = None
+
+# In-flight Baileys sends; matches the client's connection pool so a burst
+# of concurrent dispatches waits here, untimed, rather than in the pool
+# where the wait would count against each request's 30s timeout
+_BAILEYS_CONCURRENCY = 32
+_baileys_semaphore = asyncio.Semaphore(_BAILEYS_CONCURRENCY)
+
+
+def get_baileys_client() -> httpx.AsyncClient:
+    """Lazily create the shared Baileys HTTP client."""
+    global _baileys_client
+    if _baileys_client is None:
+        _baileys_client = httpx.AsyncClient(
+            base_url=_BAILEYS_URL,
+            headers={
+                "X-API-Key": _BAILEYS_API_KEY,
+                "Content-Type": "application/json",
+            },
+            limits=httpx.Limits(
+                max_connections=_BAILEYS_CONCURRENCY,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0,
+            ),
+            timeout=httpx.Timeout(30.0),
+        )
+    return _baileys_client
+
+
+async def close_baileys_client() -> None:
+    """Close the shared Baileys client (called on app shutdown)."""
+    global _baileys_client
+    if _baileys_client is not None:
+        await _baileys_client.aclose()
+        _baileys_client = None
+
+
+async def _send_whatsapp(session_id: str, to: str, message: str) -> bool:
+    """Send one WhatsApp message over the pooled Baileys client.
+
+    Returns True if Baileys delivered it; transport errors are raised.
+    """
+    async with _baileys_semaphore:
+        response = await get_baileys_client().post(
+            f"/sessions/{session_id}/send",
+            json={"to": _normalize_mobile(to), "message": message},
+        )
+    if response.status_code != 200:
+        log.warning(f"WhatsApp send failed: {response.status_code} - {response.text}")
+        return False
+    return True
+
+
+# Connected session ID and the monotonic time it was fetched
+_session_id_cache: tuple[str | None, float] = (None, 0.0)
+_SESSION_TTL = 30.0
+_session_id_lock = asyncio.Lock()
+
+# UI acks for the filing success screen: when each dispute was last acked,
+# and the dispatches currently waiting on it (one event per waiter). Keeping
+# the ack time means an ack that lands before a dispatch starts waiting
+# still counts.
+_ui_acked_at: dict[str, float] = {}
+_ui_ack_waiters: dict[str, set[asyncio.Event]] = {}
+_UI_ACK_TTL = 60.0
+
+
+# Separators dropped from phone numbers in a single pass
+_PHONE_STRIP = str.maketrans("", "", "+ -")
 
 
 def _normalize_mobile(number: str) -> str:
     """Ensure mobile number has 91 country code prefix for WhatsApp JID."""
-    digits = number.strip().replace("+", "").replace(" ", "").replace("-", "")
+    digits = number.translate(_PHONE_STRIP).strip()
     if digits.startswith("91") and len(digits) == 12:
         return digits  # Already has country code
     if len(digits) == 10:
@@ -24,36 +116,164 @@ async def _get_baileys_session_id() -> str | None:
 
     Returns the WhatsAppAuth.id of the connected session, which is
     used as the Baileys session identifier for sending messages.
+    The result is cached for ``_SESSION_TTL`` seconds; connect and
+    disconnect handlers call ``invalidate_baileys_session_cache()``.
+    """
+    global _session_id_cache
+
+    session_id, fetched_at = _session_id_cache
+    if time.monotonic() - fetched_at < _SESSION_TTL:
+        return session_id
+
+    async with _session_id_lock:
+        # Another dispatch may have refreshed the cache while we waited
+        session_id, fetched_at = _session_id_cache
+        if time.monotonic() - fetched_at < _SESSION_TTL:
+            return session_id
+
+        try:
+            async with async_session_factory() as db:
+                result = await db.execute(
+                    select(WhatsAppAuth).where(WhatsAppAuth.status == "connected")
+                )
+                auth = result.scalar_one_or_none()
+                session_id = str(auth.id) if auth else None
+        except Exception as e:
+            log.error(f"Failed to get Baileys session ID: {e}")
+            return None
+
+        _session_id_cache = (session_id, time.monotonic())
+        return session_id
+
+
+def invalidate_baileys_session_cache() -> None:
+    """Drop the cached session ID after a WhatsApp connect/disconnect."""
+    global _session_id_cache
+    _session_id_cache = (None, 0.0)
+
+
+def signal_ui_ack(dispute_id: str) -> None:
+    """Record the UI ack and release every dispatch waiting on this dispute."""
+    now = time.monotonic()
+    for stale in [d for d, at in _ui_acked_at.items() if now - at > _UI_ACK_TTL]:
+        del _ui_acked_at[stale]
+    _ui_acked_at[dispute_id] = now
+    for event in _ui_ack_waiters.get(dispute_id, ()):
+        event.set()
+
+
+async def _wait_for_ui_ack(dispute_id: str, timeout: float) -> None:
+    """Wait until the UI acks the dispute, or ``timeout`` seconds at most.
+
+    Returns at once if the UI already acked within ``_UI_ACK_TTL``.
     """
-    from src.db.session import async_session_factory
-    from src.db.models.whatsapp_auth import WhatsAppAuth
-    from sqlalchemy import select
+    acked_at = _ui_acked_at.get(dispute_id)
+    if acked_at is not None and time.monotonic() - acked_at <= _UI_ACK_TTL:
+        return
 
+    event = asyncio.Event()
+    waiters = _ui_ack_waiters.setdefault(dispute_id, set())
+    waiters.add(event)
     try:
-        async with async_session_factory() as db:
-            result = await db.execute(
-                select(WhatsAppAuth).where(WhatsAppAuth.status == "connected")
-            )
-            auth = result.scalar_one_or_none()
-            if auth:
-                return str(auth.id)
-    except Exception as e:
-        log.error(f"Failed to get Baileys session ID: {e}")
-    return None
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+    except TimeoutError:
+        pass
+    finally:
+        waiters.discard(event)
+        if not waiters:
+            _ui_ack_waiters.pop(dispute_id, None)
+
 
 # Required fields for a complete case filing
-REQUIRED_FIELDS = {
+REQUIRED_FIELDS = frozenset({
     "title", "respondent_name", "seller_mobile",
     "goods_services_description", "invoice_amount",
     # WhatsApp agent collects these:
     "respondent_email", "respondent_gstin", "respondent_state",
     "respondent_address", "po_number",
-}
+})
 
-VOICE_FIELDS = {
+VOICE_FIELDS = frozenset({
     "title", "respondent_name", "respondent_mobile", "seller_mobile",
     "goods_services_description", "invoice_amount",
-}
+})
+
+# Follow-up prompt per field, in the order they are asked
+_MISSING_LABELS: Mapping[str, str] = MappingProxyType({
+    "title": "Case ka title",
+    "respondent_name": "Buyer/Respondent ka naam",
+    "respondent_mobile": "Buyer ka mobile number",
+    "goods_services_description": "Kya goods/services supply kiye",
+    "invoice_amount": "Invoice amount kitna hai",
+    "respondent_email": "Buyer ka email address",
+    "respondent_gstin": "Buyer ka GSTIN number",
+    "respondent_state": "Buyer ka state/city",
+    "respondent_address": "Buyer ka full address",
+    "po_number": "Purchase Order (PO) number",
+})
+
+# Details still asked of the seller once the case is filed: (column, prompt)
+_FOLLOWUP_FIELDS: tuple[tuple[str, str], ...] = (
+    ("respondent_email", "Buyer ka email address"),
+    ("respondent_gstin", "Buyer ka GSTIN number (15 characters)"),
+    ("respondent_state", "Buyer ka state"),
+    ("respondent_address", "Buyer ka full address"),
+    ("po_number", "Purchase Order (PO) number"),
+)
+
+# WhatsApp message templates, filled with str.format_map
+_FOLLOWUP_HEADER = (
+    'Namaste! ODRMitra se aapka case "{title}" register ho gaya hai '
+    "(Case ID: {case_ref}...).\n\n"
+)
+_FOLLOWUP_MISSING_TEMPLATE = _FOLLOWUP_HEADER + (
+    "Kuch aur details chahiye hain case ko complete karne ke liye:\n"
+    "{items}"
+    "\nPlease ek ek karke yeh details share karein. "
+    "Agar invoice PDF hai toh woh bhi bhej dijiye.\n\n"
+    "Dhanyavaad!"
+)
+_FOLLOWUP_COMPLETE_TEMPLATE = _FOLLOWUP_HEADER + (
+    "Voice call se sab basic details mil gayi hain. "
+    "Ab kuch additional details chahiye — GSTIN, PO number, buyer address, etc.\n\n"
+    "Please ek ek karke share karein. Dhanyavaad!"
+)
+_CASE_FILED_TEMPLATE = (
+    "Aapka case successfully file ho gaya hai!\n\n"
+    "Case Number: {case_number}\n"
+    "Status: Filed\n"
+    "Respondent: {respondent_name}\n\n"
+    "Hum aapko updates dete rahenge. Dhanyavaad!"
+)
+_EX_PARTE_TEMPLATE = (
+    "⚖️ *Update — {case_number}*\n\n"
+    "Buyer ne {window_days} din ke andar apna jawab (SOD) file nahi kiya.\n\n"
+    "Aapka case ab *ex-parte* aage badh gaya hai — mutual settlement "
+    "stage (Pre-MSEFC). Aap AI outcome prediction dekh sakte hain ya "
+    "MSEFC reference ke liye aage badh sakte hain. Buyer ka jawab na "
+    "dena aapke paksh ko mazboot karta hai."
+)
+_SELLER_CASE_FILED_TEMPLATE = (
+    "*ODRMitra — Case Filed Successfully!*\n\n"
+    "Case Number: {case_number}\n"
+    "Respondent: {respondent_name}\n"
+    "Amount: {amount}\n"
+    "Status: Filed\n\n"
+    "Respondent ko intimation notice bhej diya gaya hai.\n"
+)
+_SELLER_MISSING_TAIL = (
+    "\nAage ki process ke liye kuch aur details chahiye:\n"
+    "{items}"
+    "\nInvoice PDF bhi bhej dijiye agar available hai.\n"
+    "Please ek ek karke yeh details yahan share karein.\n\n"
+    "Dhanyavaad!"
+)
+_SELLER_COMPLETE_TAIL = "\nSab details mil gayi hain. Hum aapko updates dete rahenge. Dhanyavaad!"
+
+
+def _numbered(items: list[str]) -> str:
+    """Render items as a 1-based numbered list, one per line."""
+    return "".join(f"{i}. {item}\n" for i, item in enumerate(items, 1))
 
 
 async def dispatch_whatsapp_followup(
@@ -71,51 +291,24 @@ async def dispatch_whatsapp_followup(
         collected_fields: Fields already collected via voice
     """
     try:
-        # Wait a bit for voice UI to show success
-        await asyncio.sleep(3)
+        # Let the voice UI show success first
+        await _wait_for_ui_ack(dispute_id, timeout=3.0)
 
         # Calculate what's actually missing (works for both partial and complete voice sessions)
-        provided = set(k for k, v in collected_fields.items() if v)
-        missing = REQUIRED_FIELDS - provided
-        missing_labels = {
-            "title": "Case ka title",
-            "respondent_name": "Buyer/Respondent ka naam",
-            "respondent_mobile": "Buyer ka mobile number",
-            "goods_services_description": "Kya goods/services supply kiye",
-            "invoice_amount": "Invoice amount kitna hai",
-            "respondent_email": "Buyer ka email address",
-            "respondent_gstin": "Buyer ka GSTIN number",
-            "respondent_state": "Buyer ka state/city",
-            "respondent_address": "Buyer ka full address",
-            "po_number": "Purchase Order (PO) number",
-        }
-
-        missing_items = [missing_labels.get(f, f) for f in missing if f in missing_labels]
+        provided = {k for k, v in collected_fields.items() if v}
+        missing_items = [
+            label for field, label in _MISSING_LABELS.items()
+            if field in REQUIRED_FIELDS and field not in provided
+        ]
 
         # Build WhatsApp message
-        title = collected_fields.get("title", "your dispute")
-        if missing_items:
-            message = (
-                f"Namaste! ODRMitra se aapka case \"{title}\" register ho gaya hai "
-                f"(Case ID: {dispute_id[:8]}...).\n\n"
-                f"Kuch aur details chahiye hain case ko complete karne ke liye:\n"
-            )
-            for i, item in enumerate(missing_items[:6], 1):
-                message += f"{i}. {item}\n"
-
-            message += (
-                "\nPlease ek ek karke yeh details share karein. "
-                "Agar invoice PDF hai toh woh bhi bhej dijiye.\n\n"
-                "Dhanyavaad!"
-            )
-        else:
-            message = (
-                f"Namaste! ODRMitra se aapka case \"{title}\" register ho gaya hai "
-                f"(Case ID: {dispute_id[:8]}...).\n\n"
-                f"Voice call se sab basic details mil gayi hain. "
-                f"Ab kuch additional details chahiye — GSTIN, PO number, buyer address, etc.\n\n"
-                f"Please ek ek karke share karein. Dhanyavaad!"
-            )
+        values = {
+            "title": collected_fields.get("title", "your dispute"),
+            "case_ref": dispute_id[:8],
+            "items": _numbered(missing_items[:6]),
+        }
+        template = _FOLLOWUP_MISSING_TEMPLATE if missing_items else _FOLLOWUP_COMPLETE_TEMPLATE
+        message = template.format_map(values)
 
         # Find the active Baileys session (not the user_id — Baileys uses WhatsAppAuth.id)
         session_id = await _get_baileys_session_id()
@@ -124,27 +317,12 @@ async def dispatch_whatsapp_followup(
             return
 
         # Send via Baileys
-        import httpx
-        baileys_url = settings.get("baileys_service_url", "http://127.0.0.1:3001")
-        api_key = settings.get("baileys_api_key", "baileys-secret-key")
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{baileys_url}/sessions/{session_id}/send",
-                json={"to": _normalize_mobile(seller_mobile), "message": message},
-                headers={
-                    "X-API-Key": api_key,
-                    "Content-Type": "application/json",
-                },
-                timeout=30.0,
-            )
-            if response.status_code == 200:
-                log.info(f"WhatsApp followup sent to {seller_mobile} for dispute {dispute_id}")
-            else:
-                log.warning(f"WhatsApp followup failed: {response.status_code} - {response.text}")
+        if await _send_whatsapp(session_id, seller_mobile, message):
+            log.info(f"WhatsApp followup sent to {seller_mobile} for dispute {dispute_id}")
+        else:
+            log.warning(f"WhatsApp followup to {seller_mobile} failed for dispute {dispute_id}")
 
     except Exception as e:
-        import traceback
         log.error(f"dispatch_whatsapp_followup failed: {e}\n{traceback.format_exc()}")
 
 
@@ -158,63 +336,37 @@ async def dispatch_case_processing(dispute_id: str, user_id: str):
     5. Notify seller
     """
     try:
-        await asyncio.sleep(2)
-
-        from src.db.session import async_session_factory
-        from src.db.models.dispute import Dispute, DisputeStatus
-        from sqlalchemy import select
+        await _wait_for_ui_ack(dispute_id, timeout=2.0)
 
         async with async_session_factory() as db:
-            result = await db.execute(
-                select(Dispute).where(Dispute.id == dispute_id)
-            )
-            dispute = result.scalar_one_or_none()
+            # Update status to FILED and read back what the notification needs
+            dispute = (await db.execute(
+                update(Dispute)
+                .where(Dispute.id == dispute_id)
+                .values(status=DisputeStatus.FILED.value)
+                .returning(Dispute.case_number, Dispute.respondent_name, Dispute.claimant_id)
+            )).first()
             if not dispute:
                 log.error(f"Dispute {dispute_id} not found for case processing")
                 return
-
-            # Update status to FILED
-            dispute.status = DisputeStatus.FILED.value
             await db.commit()
 
             log.info(f"Case {dispute.case_number} processed and filed successfully")
 
             # Notify seller via WhatsApp
-            # Find seller mobile from dispute or user
-            from src.db.models.user import User
-            user_result = await db.execute(
-                select(User).where(User.id == dispute.claimant_id)
-            )
-            claimant = user_result.scalar_one_or_none()
-
+            claimant = await db.get(User, dispute.claimant_id)
             if claimant and claimant.mobile_number:
                 session_id = await _get_baileys_session_id()
                 if not session_id:
                     log.warning("No connected Baileys session — cannot notify seller")
                     return
 
-                notify_message = (
-                    f"Aapka case successfully file ho gaya hai!\n\n"
-                    f"Case Number: {dispute.case_number}\n"
-                    f"Status: Filed\n"
-                    f"Respondent: {dispute.respondent_name}\n\n"
-                    f"Hum aapko updates dete rahenge. Dhanyavaad!"
-                )
+                notify_message = _CASE_FILED_TEMPLATE.format_map({
+                    "case_number": dispute.case_number,
+                    "respondent_name": dispute.respondent_name,
+                })
 
-                import httpx
-                baileys_url = settings.get("baileys_service_url", "http://127.0.0.1:3001")
-                api_key = settings.get("baileys_api_key", "baileys-secret-key")
-
-                async with httpx.AsyncClient() as client:
-                    await client.post(
-                        f"{baileys_url}/sessions/{session_id}/send",
-                        json={"to": _normalize_mobile(claimant.mobile_number), "message": notify_message},
-                        headers={
-                            "X-API-Key": api_key,
-                            "Content-Type": "application/json",
-                        },
-                        timeout=30.0,
-                    )
+                await _send_whatsapp(session_id, claimant.mobile_number, notify_message)
 
     except Exception as e:
         log.error(f"dispatch_case_processing failed for dispute {dispute_id}: {e}")
@@ -227,17 +379,12 @@ def advance_expired_sod(dispute) -> bool:
     Mutates the dispute (caller's session commits) and returns True when the
     transition happened — the caller then dispatches the seller notification.
     """
-    from datetime import datetime, timedelta, timezone
-
-    from src.db.models.dispute import DisputeStatus
-
     if dispute.status != DisputeStatus.INTIMATION_SENT.value:
         return False
     if not dispute.intimation_sent_at or dispute.buyer_objections:
         return False
 
-    window_days = int(settings.get("sod_response_days", 15))
-    deadline = dispute.intimation_sent_at + timedelta(days=window_days)
+    deadline = dispute.intimation_sent_at + timedelta(days=_SOD_RESPONSE_DAYS)
     now = datetime.now(timezone.utc)
     if now <= deadline:
         return False
@@ -257,28 +404,13 @@ def advance_expired_sod(dispute) -> bool:
 async def dispatch_ex_parte_notice(dispute_id: str) -> None:
     """Tell the seller the buyer stayed silent and the case moved forward."""
     try:
-        import uuid
-
-        import httpx
-        from sqlalchemy import select
-
-        from src.db.session import async_session_factory
-        from src.db.models.dispute import Dispute
-        from src.db.models.user import User
-
         async with async_session_factory() as db:
-            dispute = (
-                await db.execute(
-                    select(Dispute).where(Dispute.id == uuid.UUID(dispute_id))
-                )
-            ).scalar_one_or_none()
+            dispute = await db.get(
+                Dispute, uuid.UUID(dispute_id), options=[joinedload(Dispute.claimant)]
+            )
             if not dispute:
                 return
-            claimant = (
-                await db.execute(
-                    select(User).where(User.id == dispute.claimant_id)
-                )
-            ).scalar_one_or_none()
+            claimant = dispute.claimant
 
         if not claimant or not claimant.mobile_number:
             return
@@ -286,24 +418,11 @@ async def dispatch_ex_parte_notice(dispute_id: str) -> None:
         if not session_id:
             return
 
-        window_days = int(settings.get("sod_response_days", 15))
-        message = (
-            f"⚖️ *Update — {dispute.case_number}*\n\n"
-            f"Buyer ne {window_days} din ke andar apna jawab (SOD) file nahi kiya.\n\n"
-            f"Aapka case ab *ex-parte* aage badh gaya hai — mutual settlement "
-            f"stage (Pre-MSEFC). Aap AI outcome prediction dekh sakte hain ya "
-            f"MSEFC reference ke liye aage badh sakte hain. Buyer ka jawab na "
-            f"dena aapke paksh ko mazboot karta hai."
-        )
-        baileys_url = settings.get("baileys_service_url", "http://127.0.0.1:3001")
-        api_key = settings.get("baileys_api_key", "baileys-secret-key")
-        async with httpx.AsyncClient() as client:
-            await client.post(
-                f"{baileys_url}/sessions/{session_id}/send",
-                json={"to": _normalize_mobile(claimant.mobile_number), "message": message},
-                headers={"X-API-Key": api_key, "Content-Type": "application/json"},
-                timeout=30.0,
-            )
+        message = _EX_PARTE_TEMPLATE.format_map({
+            "case_number": dispute.case_number,
+            "window_days": _SOD_RESPONSE_DAYS,
+        })
+        await _send_whatsapp(session_id, claimant.mobile_number, message)
         log.info(f"Ex-parte notice sent to seller for {dispute.case_number}")
     except Exception as e:
         log.error(f"dispatch_ex_parte_notice failed: {e}")
@@ -356,24 +475,15 @@ async def dispatch_buyer_intimation(
 ):
     """Send intimation notice to buyer via WhatsApp."""
     try:
-        await asyncio.sleep(5)
-
-        from src.db.session import async_session_factory
-        from src.db.models.dispute import Dispute
-        from src.db.models.user import User
-        from sqlalchemy import select
+        await _wait_for_ui_ack(dispute_id, timeout=5.0)
 
         async with async_session_factory() as db:
-            result = await db.execute(
-                select(Dispute).where(Dispute.id == dispute_id)
+            dispute = await db.get(
+                Dispute, dispute_id, options=[joinedload(Dispute.claimant)]
             )
-            dispute = result.scalar_one_or_none()
             if not dispute:
                 return
-
-            claimant = (
-                await db.execute(select(User).where(User.id == dispute.claimant_id))
-            ).scalar_one_or_none()
+            claimant = dispute.claimant
 
             message = _build_buyer_intimation(dispute, claimant)
 
@@ -382,25 +492,11 @@ async def dispatch_buyer_intimation(
                 log.warning("No connected Baileys session — cannot send buyer intimation")
                 return
 
-            import httpx
-            baileys_url = settings.get("baileys_service_url", "http://127.0.0.1:3001")
-            api_key = settings.get("baileys_api_key", "baileys-secret-key")
-
-            async with httpx.AsyncClient() as client:
-                await client.post(
-                    f"{baileys_url}/sessions/{session_id}/send",
-                    json={"to": _normalize_mobile(buyer_mobile), "message": message},
-                    headers={
-                        "X-API-Key": api_key,
-                        "Content-Type": "application/json",
-                    },
-                    timeout=30.0,
-                )
-                log.info(f"Buyer intimation sent to {buyer_mobile} for case {dispute.case_number}")
+            await _send_whatsapp(session_id, buyer_mobile, message)
+            log.info(f"Buyer intimation sent to {buyer_mobile} for case {dispute.case_number}")
 
-                from datetime import datetime, timezone
-                dispute.intimation_sent_at = datetime.now(timezone.utc)
-                await db.commit()
+            dispute.intimation_sent_at = datetime.now(timezone.utc)
+            await db.commit()
 
     except Exception as e:
         log.error(f"dispatch_buyer_intimation failed: {e}")
@@ -409,121 +505,83 @@ async def dispatch_buyer_intimation(
 async def dispatch_buyer_and_seller_intimation(dispute_id: str, user_id: str):
     """After all fields collected via WhatsApp, notify both seller and buyer."""
     try:
-        await asyncio.sleep(2)
-
-        from src.db.session import async_session_factory
-        from src.db.models.dispute import Dispute, DisputeStatus
-        from src.db.models.user import User
-        from sqlalchemy import select
+        await _wait_for_ui_ack(dispute_id, timeout=2.0)
 
         async with async_session_factory() as db:
-            result = await db.execute(
-                select(Dispute).where(Dispute.id == dispute_id)
+            # Dispute and its claimant (seller) in one primary-key lookup
+            dispute = await db.get(
+                Dispute, dispute_id, options=[joinedload(Dispute.claimant)]
             )
-            dispute = result.scalar_one_or_none()
             if not dispute:
                 log.error(f"Dispute {dispute_id} not found for intimation")
                 return
+            claimant = dispute.claimant
 
-            # Update status to FILED
+            # Update status to FILED; committed together with the
+            # intimation outcome below (or alone if sending fails)
             dispute.status = DisputeStatus.FILED.value
-            await db.commit()
+            try:
+                log.info(f"Case {dispute.case_number} processed — sending intimations")
 
-            log.info(f"Case {dispute.case_number} processed — sending intimations")
-
-            # Get claimant (seller) info
-            user_result = await db.execute(
-                select(User).where(User.id == dispute.claimant_id)
-            )
-            claimant = user_result.scalar_one_or_none()
-
-            session_id = await _get_baileys_session_id()
-            if not session_id:
-                log.warning("No connected Baileys session — cannot send intimations")
-                return
+                session_id = await _get_baileys_session_id()
+                if not session_id:
+                    log.warning("No connected Baileys session — cannot send intimations")
+                    return
 
-            import httpx
-            baileys_url = settings.get("baileys_service_url", "http://127.0.0.1:3001")
-            api_key = settings.get("baileys_api_key", "baileys-secret-key")
+                # party -> (mobile, message)
+                sends: dict[str, tuple[str, str]] = {}
 
-            async with httpx.AsyncClient() as client:
                 # 1. Notify seller: case filed + ask for remaining details
                 if claimant and claimant.mobile_number:
                     amount = f"₹{dispute.invoice_amount:,.2f}" if dispute.invoice_amount else "N/A"
-                    seller_msg = (
-                        f"*ODRMitra — Case Filed Successfully!*\n\n"
-                        f"Case Number: {dispute.case_number}\n"
-                        f"Respondent: {dispute.respondent_name}\n"
-                        f"Amount: {amount}\n"
-                        f"Status: Filed\n\n"
-                        f"Respondent ko intimation notice bhej diya gaya hai.\n"
-                    )
-
-                    # Build missing details list
-                    missing_labels = {
-                        "respondent_email": "Buyer ka email address",
-                        "respondent_gstin": "Buyer ka GSTIN number (15 characters)",
-                        "respondent_state": "Buyer ka state",
-                        "respondent_address": "Buyer ka full address",
-                        "po_number": "Purchase Order (PO) number",
-                    }
+                    seller_msg = _SELLER_CASE_FILED_TEMPLATE.format_map({
+                        "case_number": dispute.case_number,
+                        "respondent_name": dispute.respondent_name,
+                        "amount": amount,
+                    })
+
                     # Check which fields are missing from the dispute record
-                    missing_items = []
-                    if not dispute.respondent_email:
-                        missing_items.append(missing_labels["respondent_email"])
-                    if not dispute.respondent_gstin:
-                        missing_items.append(missing_labels["respondent_gstin"])
-                    if not getattr(dispute, "respondent_state", None):
-                        missing_items.append(missing_labels["respondent_state"])
-                    if not getattr(dispute, "respondent_address", None):
-                        missing_items.append(missing_labels["respondent_address"])
-                    if not getattr(dispute, "po_number", None):
-                        missing_items.append(missing_labels["po_number"])
+                    missing_items = [
+                        label for field, label in _FOLLOWUP_FIELDS
+                        if not getattr(dispute, field)
+                    ]
 
                     if missing_items:
-                        seller_msg += (
-                            f"\nAage ki process ke liye kuch aur details chahiye:\n"
-                        )
-                        for i, item in enumerate(missing_items, 1):
-                            seller_msg += f"{i}. {item}\n"
-                        seller_msg += (
-                            f"\nInvoice PDF bhi bhej dijiye agar available hai.\n"
-                            f"Please ek ek karke yeh details yahan share karein.\n\n"
-                            f"Dhanyavaad!"
-                        )
+                        seller_msg += _SELLER_MISSING_TAIL.format_map({"items": _numbered(missing_items)})
                     else:
-                        seller_msg += "\nSab details mil gayi hain. Hum aapko updates dete rahenge. Dhanyavaad!"
-
-                    await client.post(
-                        f"{baileys_url}/sessions/{session_id}/send",
-                        json={"to": _normalize_mobile(claimant.mobile_number), "message": seller_msg},
-                        headers={
-                            "X-API-Key": api_key,
-                            "Content-Type": "application/json",
-                        },
-                        timeout=30.0,
-                    )
-                    log.info(f"Seller notification sent to {claimant.mobile_number}")
+                        seller_msg += _SELLER_COMPLETE_TAIL
+
+                    sends["seller"] = (claimant.mobile_number, seller_msg)
 
                 # 2. Send buyer intimation if respondent_mobile exists
                 if dispute.respondent_mobile:
                     buyer_msg = _build_buyer_intimation(dispute, claimant)
-                    await client.post(
-                        f"{baileys_url}/sessions/{session_id}/send",
-                        json={"to": _normalize_mobile(dispute.respondent_mobile), "message": buyer_msg},
-                        headers={
-                            "X-API-Key": api_key,
-                            "Content-Type": "application/json",
-                        },
-                        timeout=30.0,
-                    )
-                    log.info(f"Buyer intimation sent to {dispute.respondent_mobile} for case {dispute.case_number}")
+                    sends["buyer"] = (dispute.respondent_mobile, buyer_msg)
+
+                # Both messages are independent — send them concurrently
+                results = await asyncio.gather(
+                    *(
+                        _send_whatsapp(session_id, mobile, message)
+                        for mobile, message in sends.values()
+                    ),
+                    return_exceptions=True,
+                )
+                delivered = set()
+                for (party, (mobile, _)), result in zip(sends.items(), results):
+                    if result is True:
+                        delivered.add(party)
+                        log.info(f"{party.capitalize()} message sent to {mobile} for case {dispute.case_number}")
+                    elif isinstance(result, BaseException):
+                        log.warning(f"{party.capitalize()} message to {mobile} failed: {result}")
+                    else:
+                        log.warning(f"{party.capitalize()} message to {mobile} was not delivered")
 
+                if "buyer" in delivered:
                     # Record delivery and advance the workflow stage
-                    from datetime import datetime, timezone
                     dispute.intimation_sent_at = datetime.now(timezone.utc)
                     dispute.status = DisputeStatus.INTIMATION_SENT.value
-                    await db.commit()
+            finally:
+                await db.commit()
 
     except Exception as e:
         log.error(f"dispatch_buyer_and_seller_intimation failed for dispute {dispute_id}: {e}")
@@ -1,10 +1,22 @@
 """Analyze document tool — extract entities from uploaded documents."""
 
+import asyncio
+from datetime import date as date_type
 from typing import Any
 
+from sqlalchemy import select
+
 from src.tools.base import BaseTool
 from src.core.logging import log
+from src.db.session import async_session_factory
+from src.db.models.document import DisputeDocument, AnalysisStatus
+from src.db.models.dispute import Dispute
+from src.llm import get_llm_client, parse_json_reply
+from src.rag.document_parser import parse_document
+from src.db.models.invoice import Invoice
 
+# Leading document characters sent to the LLM for extraction
+_PROMPT_DOC_CHARS = 4000
 
 class AnalyzeDocumentTool(BaseTool):
     """Extract entities, amounts, dates from uploaded dispute documents."""
@@ -29,10 +41,6 @@ class AnalyzeDocumentTool(BaseTool):
         document_id = arguments["document_id"]
 
         try:
-            from src.db.session import async_session_factory
-            from src.db.models.document import DisputeDocument, AnalysisStatus
-            from sqlalchemy import select
-
             async with async_session_factory() as db:
                 result = await db.execute(
                     select(DisputeDocument).where(DisputeDocument.id == document_id)
@@ -49,16 +57,14 @@ class AnalyzeDocumentTool(BaseTool):
                 doc.analysis_status = AnalysisStatus.PROCESSING.value
                 await db.commit()
 
-                # Parse document with LlamaParse
-                try:
-                    from src.rag.document_parser import parse_document
-                    parsed_text = await parse_document(doc.file_url)
-                except Exception as e:
-                    log.warning(f"LlamaParse failed, using file directly: {e}")
-                    parsed_text = f"[Document: {doc.original_filename}]"
+                # Parse the document while the dispute auto-fill needs is loaded;
+                # parsing never touches the session, so they can overlap
+                parsed_text, dispute = await asyncio.gather(
+                    self._parse(doc),
+                    db.get(Dispute, doc.dispute_id),
+                )
 
                 # Analyze with LLM
-                from src.llm import get_llm_client
                 llm = get_llm_client()
 
                 prompt = f"""Analyze this document and extract all key information.
@@ -67,7 +73,7 @@ Document name: {doc.original_filename}
 Document type: {doc.doc_type}
 
 Document content:
-{parsed_text[:4000]}
+{parsed_text}
 
 Extract and return JSON:
 {{
@@ -93,15 +99,9 @@ Extract and return JSON:
                     temperature=0.2,
                 )
 
-                import json
                 try:
-                    content = response.content or "{}"
-                    if "```json" in content:
-                        content = content.split("```json")[1].split("```")[0]
-                    elif "```" in content:
-                        content = content.split("```")[1].split("```")[0]
-                    analysis = json.loads(content.strip())
-                except (json.JSONDecodeError, IndexError):
+                    analysis = parse_json_reply(response.content)
+                except ValueError:
                     analysis = {"summary": response.content, "raw_parse": True}
 
                 # Save results
@@ -109,10 +109,20 @@ Extract and return JSON:
                 doc.analysis_result = analysis
                 if "total_amount" in analysis:
                     doc.extracted_amount = analysis["total_amount"]
-                await db.commit()
 
                 # Auto-fill: create/update Invoice record and update Dispute financials
-                await self._auto_fill(db, doc, analysis)
+                await self._auto_fill(db, doc, dispute, analysis)
+                try:
+                    await db.commit()
+                except Exception as e:
+                    # LLM-extracted values can fail at flush (an over-long
+                    # invoice number, an amount past Numeric(15,2)); keep the
+                    # analysis anyway so the document never stays PROCESSING
+                    log.warning(f"Auto-fill writes failed, saving analysis only: {e}")
+                    await db.rollback()
+                    doc.analysis_status = AnalysisStatus.COMPLETED.value
+                    doc.analysis_result = analysis
+                    await db.commit()
 
                 return {"document_id": document_id, "status": "completed", **analysis}
 
@@ -120,14 +130,21 @@ Extract and return JSON:
             log.error(f"Document analysis failed: {e}")
             return {"error": str(e)}
 
-    async def _auto_fill(self, db, doc, analysis: dict) -> None:
-        """Create/update Invoice record from extraction and update Dispute summary fields."""
+    async def _parse(self, doc) -> str:
+        """Parse the document's leading text with LlamaParse (placeholder on failure)."""
         try:
-            from src.db.models.invoice import Invoice
-            from src.db.models.dispute import Dispute
-            from sqlalchemy import select
-            from datetime import date as date_type
+            return await parse_document(doc.file_url, max_chars=_PROMPT_DOC_CHARS)
+        except Exception as e:
+            log.warning(f"LlamaParse failed, using file directly: {e}")
+            return f"[Document: {doc.original_filename}]"
 
+    async def _auto_fill(self, db, doc, dispute, analysis: dict) -> None:
+        """Create/update Invoice record from extraction and update Dispute summary fields.
+
+        Changes are left pending; the caller commits them together with
+        the document's analysis result.
+        """
+        try:
             def parse_date(val: str | None) -> date_type | None:
                 if not val or val == "null":
                     return None
@@ -166,10 +183,6 @@ Extract and return JSON:
                 db.add(invoice)
 
             # Update Dispute summary financial fields
-            result = await db.execute(
-                select(Dispute).where(Dispute.id == doc.dispute_id)
-            )
-            dispute = result.scalar_one_or_none()
             if dispute:
                 if analysis.get("total_amount") is not None and dispute.invoice_amount is None:
                     dispute.invoice_amount = parse_float(analysis["total_amount"])
@@ -183,7 +196,5 @@ Extract and return JSON:
                     dispute.respondent_gstin = analysis["buyer_gstin"]
                 if analysis.get("buyer_pan") and not dispute.respondent_pan:
                     dispute.respondent_pan = analysis["buyer_pan"]
-
-            await db.commit()
         except Exception as e:
             log.warning(f"Auto-fill from analysis failed: {e}")
@@ -1,12 +1,29 @@
 """Calculate interest tool — Section 16 MSMED Act 2006."""
 
-from datetime import date, datetime
+from datetime import date
+from functools import lru_cache
+from math import expm1, log1p
 from typing import Any
 
 from src.tools.base import BaseTool
 from src.config import settings
 
 
+@lru_cache(maxsize=1)
+def _bank_rate() -> float:
+    """RBI bank rate (%) from settings, read once per process."""
+    return float(settings.get("RBI_BANK_RATE", 6.50))
+
+
+def compound_interest(principal: float, months: float, monthly_rate: float) -> float:
+    """Interest on ``principal`` compounded monthly for ``months`` months.
+
+    A = P(1 + r)^n, so I = P * (e^(n * ln(1 + r)) - 1); expm1/log1p keep
+    precision for small rates without building the power term.
+    """
+    return principal * expm1(months * log1p(monthly_rate))
+
+
 class CalculateInterestTool(BaseTool):
     """Calculate compound interest per Section 16 of MSMED Act 2006.
 
@@ -39,11 +56,11 @@ class CalculateInterestTool(BaseTool):
 
     async def execute(self, arguments: dict[str, Any], context: dict[str, Any]) -> dict:
         principal = arguments["principal_amount"]
-        due_date = datetime.strptime(arguments["due_date"], "%Y-%m-%d").date()
+        due_date = date.fromisoformat(arguments["due_date"])
 
         calc_date_str = arguments.get("calculation_date")
         calc_date = (
-            datetime.strptime(calc_date_str, "%Y-%m-%d").date()
+            date.fromisoformat(calc_date_str)
             if calc_date_str
             else date.today()
         )
@@ -58,7 +75,7 @@ class CalculateInterestTool(BaseTool):
             }
 
         # Section 16: Interest = 3x bank rate, compounded monthly
-        bank_rate = float(settings.get("RBI_BANK_RATE", 6.50))
+        bank_rate = _bank_rate()
         annual_rate = bank_rate * 3  # 3x bank rate
         monthly_rate = annual_rate / 12 / 100
 
@@ -66,9 +83,8 @@ class CalculateInterestTool(BaseTool):
         days_overdue = (calc_date - due_date).days
         months = days_overdue / 30.44  # Average days per month
 
-        # Compound monthly: A = P(1 + r)^n
-        total = principal * ((1 + monthly_rate) ** months)
-        interest = total - principal
+        interest = compound_interest(principal, months, monthly_rate)
+        total = principal + interest
 
         return {
             "principal": round(principal, 2),
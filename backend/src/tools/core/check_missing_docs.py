@@ -2,40 +2,56 @@
 
 from typing import Any
 
+from sqlalchemy import func, select
+
 from src.tools.base import BaseTool
 from src.core.logging import log
+from src.db.session import async_session_factory
+from src.db.models.dispute import Dispute
+from src.db.models.document import DisputeDocument
+
+
+# Required docs per dispute category: (type, label, mandatory)
+REQUIRED_DOCS: dict[str, tuple[tuple[str, str, bool], ...]] = {
+    "default": (
+        ("invoice", "Invoice / Bill", True),
+        ("udyam_certificate", "Udyam Registration Certificate", True),
+        ("affidavit", "Affidavit", True),
+    ),
+    "delayed_payment": (
+        ("invoice", "Invoice / Bill", True),
+        ("udyam_certificate", "Udyam Registration Certificate", True),
+        ("affidavit", "Affidavit", True),
+        ("purchase_order", "Purchase Order", False),
+        ("delivery_challan", "Delivery Challan / Proof of Delivery", False),
+        ("correspondence", "Payment Reminder / Correspondence", False),
+    ),
+    "non_payment": (
+        ("invoice", "Invoice / Bill", True),
+        ("udyam_certificate", "Udyam Registration Certificate", True),
+        ("affidavit", "Affidavit", True),
+        ("purchase_order", "Purchase Order", True),
+        ("delivery_challan", "Delivery Challan / Proof of Delivery", True),
+        ("correspondence", "Demand Notice / Correspondence", False),
+    ),
+    "disputed_quality": (
+        ("invoice", "Invoice / Bill", True),
+        ("udyam_certificate", "Udyam Registration Certificate", True),
+        ("affidavit", "Affidavit", True),
+        ("contract", "Contract / Agreement with Quality Specs", True),
+        ("correspondence", "Quality Objection Correspondence", True),
+    ),
+}
 
-
-# Required docs per dispute category
-REQUIRED_DOCS = {
-    "default": [
-        {"type": "invoice", "label": "Invoice / Bill", "mandatory": True},
-        {"type": "udyam_certificate", "label": "Udyam Registration Certificate", "mandatory": True},
-        {"type": "affidavit", "label": "Affidavit", "mandatory": True},
-    ],
-    "delayed_payment": [
-        {"type": "invoice", "label": "Invoice / Bill", "mandatory": True},
-        {"type": "udyam_certificate", "label": "Udyam Registration Certificate", "mandatory": True},
-        {"type": "affidavit", "label": "Affidavit", "mandatory": True},
-        {"type": "purchase_order", "label": "Purchase Order", "mandatory": False},
-        {"type": "delivery_challan", "label": "Delivery Challan / Proof of Delivery", "mandatory": False},
-        {"type": "correspondence", "label": "Payment Reminder / Correspondence", "mandatory": False},
-    ],
-    "non_payment": [
-        {"type": "invoice", "label": "Invoice / Bill", "mandatory": True},
-        {"type": "udyam_certificate", "label": "Udyam Registration Certificate", "mandatory": True},
-        {"type": "affidavit", "label": "Affidavit", "mandatory": True},
-        {"type": "purchase_order", "label": "Purchase Order", "mandatory": True},
-        {"type": "delivery_challan", "label": "Delivery Challan / Proof of Delivery", "mandatory": True},
-        {"type": "correspondence", "label": "Demand Notice / Correspondence", "mandatory": False},
-    ],
-    "disputed_quality": [
-        {"type": "invoice", "label": "Invoice / Bill", "mandatory": True},
-        {"type": "udyam_certificate", "label": "Udyam Registration Certificate", "mandatory": True},
-        {"type": "affidavit", "label": "Affidavit", "mandatory": True},
-        {"type": "contract", "label": "Contract / Agreement with Quality Specs", "mandatory": True},
-        {"type": "correspondence", "label": "Quality Objection Correspondence", "mandatory": True},
-    ],
+# Per category, built once: (mandatory types, recommended types, type -> label).
+# Types stay in REQUIRED_DOCS order so the reported lists are stable.
+_CATEGORY_INDEX: dict[str, tuple[tuple[str, ...], tuple[str, ...], dict[str, str]]] = {
+    category: (
+        tuple(doc_type for doc_type, _, mandatory in docs if mandatory),
+        tuple(doc_type for doc_type, _, mandatory in docs if not mandatory),
+        {doc_type: label for doc_type, label, _ in docs},
+    )
+    for category, docs in REQUIRED_DOCS.items()
 }
 
 
@@ -62,42 +78,36 @@ class CheckMissingDocsTool(BaseTool):
         dispute_id = arguments["dispute_id"]
 
         try:
-            from src.db.session import async_session_factory
-            from src.db.models.dispute import Dispute
-            from src.db.models.document import DisputeDocument
-            from sqlalchemy import select
-
             async with async_session_factory() as db:
-                # Get dispute
-                result = await db.execute(
-                    select(Dispute).where(Dispute.id == dispute_id)
-                )
-                dispute = result.scalar_one_or_none()
-                if not dispute:
+                # Dispute category and its distinct uploaded doc types in one query
+                row = (await db.execute(
+                    select(
+                        Dispute.category,
+                        func.array_agg(DisputeDocument.doc_type.distinct()).filter(
+                            DisputeDocument.id.is_not(None)
+                        ),
+                        func.count(DisputeDocument.id),
+                    )
+                    .select_from(Dispute)
+                    .outerjoin(DisputeDocument, DisputeDocument.dispute_id == Dispute.id)
+                    .where(Dispute.id == dispute_id)
+                    .group_by(Dispute.id)
+                )).first()
+                if row is None:
                     return {"error": f"Dispute {dispute_id} not found"}
 
-                # Get uploaded docs
-                result = await db.execute(
-                    select(DisputeDocument).where(DisputeDocument.dispute_id == dispute_id)
-                )
-                uploaded_docs = result.scalars().all()
-                uploaded_types = {d.doc_type for d in uploaded_docs}
+                dispute_category, doc_types, total_uploaded = row
+                uploaded_types = frozenset(doc_types or ())
 
                 # Get required docs for category
-                category = dispute.category or "default"
-                required = REQUIRED_DOCS.get(category, REQUIRED_DOCS["default"])
-
-                missing_mandatory = []
-                missing_recommended = []
-                uploaded_list = []
+                category = dispute_category or "default"
+                mandatory, recommended, labels = _CATEGORY_INDEX.get(
+                    category, _CATEGORY_INDEX["default"]
+                )
 
-                for req in required:
-                    if req["type"] in uploaded_types:
-                        uploaded_list.append(req["label"])
-                    elif req["mandatory"]:
-                        missing_mandatory.append(req["label"])
-                    else:
-                        missing_recommended.append(req["label"])
+                uploaded_list = [labels[t] for t in labels if t in uploaded_types]
+                missing_mandatory = [labels[t] for t in mandatory if t not in uploaded_types]
+                missing_recommended = [labels[t] for t in recommended if t not in uploaded_types]
 
                 is_complete = len(missing_mandatory) == 0
 
@@ -108,7 +118,7 @@ class CheckMissingDocsTool(BaseTool):
                     "uploaded": uploaded_list,
                     "missing_mandatory": missing_mandatory,
                     "missing_recommended": missing_recommended,
-                    "total_uploaded": len(uploaded_docs),
+                    "total_uploaded": total_uploaded,
                     "message": (
                         "All mandatory documents are uploaded."
                         if is_complete
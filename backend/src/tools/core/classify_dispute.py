@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from src.llm import get_llm_client, parse_json_reply
 from src.tools.base import BaseTool
 from src.core.logging import log
 
@@ -34,8 +35,6 @@ class ClassifyDisputeTool(BaseTool):
         claimed_amount = arguments.get("claimed_amount")
 
         try:
-            from src.llm import get_llm_client
-
             llm = get_llm_client()
 
             prompt = f"""Analyze this MSME delayed payment dispute and classify it.
@@ -59,16 +58,9 @@ Respond in JSON format:
                 temperature=0.3,
             )
 
-            import json
             try:
-                content = response.content or "{}"
-                # Try to extract JSON from response
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0]
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0]
-                result = json.loads(content.strip())
-            except (json.JSONDecodeError, IndexError):
+                result = parse_json_reply(response.content)
+            except ValueError:
                 result = {
                     "category": "delayed_payment",
                     "sub_category": "general",
@@ -1,10 +1,15 @@
 """Create new case tool — file a fresh dispute from collected details."""
 
 import asyncio
+import uuid
 from typing import Any
 
 from src.tools.base import BaseTool
 from src.core.logging import log
+from src.db.session import async_session_factory
+from src.db.models.dispute import Dispute, DisputeStatus
+from src.api.routes.disputes import _generate_case_number
+from src.tasks.dispatcher import dispatch_buyer_and_seller_intimation
 
 
 class CreateNewCaseTool(BaseTool):
@@ -50,12 +55,6 @@ class CreateNewCaseTool(BaseTool):
     }
 
     async def execute(self, arguments: dict[str, Any], context: dict[str, Any]) -> dict:
-        import uuid
-
-        from src.db.session import async_session_factory
-        from src.db.models.dispute import Dispute, DisputeStatus
-        from src.api.routes.disputes import _generate_case_number
-
         user_id = context.get("user_id")
 
         person = (arguments.get("respondent_name") or "").strip()
@@ -93,8 +92,6 @@ class CreateNewCaseTool(BaseTool):
 
             # Step 3 intimation: buyer notice + seller follow-up
             if arguments.get("respondent_mobile"):
-                from src.tasks.dispatcher import dispatch_buyer_and_seller_intimation
-
                 asyncio.create_task(
                     dispatch_buyer_and_seller_intimation(
                         dispute_id=dispute_id, user_id=str(user_id)
@@ -2,8 +2,35 @@
 
 from typing import Any
 
+from sqlalchemy import select
+
+from src.llm import get_llm_client
 from src.tools.base import BaseTool
 from src.core.logging import log
+from src.db.session import async_session_factory
+from src.db.models.dispute import Dispute
+from src.db.models.settlement import SettlementAgreement, SettlementStatus
+
+# Prompt template, bound to str.format once at import
+_SETTLEMENT_PROMPT = """Draft a formal settlement agreement in markdown for this MSME dispute:
+
+Case Number: {case_number}
+Claimant: (from case records)
+Respondent: {respondent}
+Original Claim: {claimed}
+Settlement Amount: INR {settlement_amount:,.2f}
+Payment Terms: {payment_terms}
+{additional}
+
+Generate a professional settlement agreement markdown with:
+1. Title and case reference
+2. Parties section
+3. Recitals (background of dispute)
+4. Settlement terms (amount, payment schedule)
+5. Release and discharge clause
+6. Confidentiality clause
+7. Governing law (MSMED Act 2006)
+8. Signature blocks""".format
 
 
 class DraftSettlementTool(BaseTool):
@@ -44,51 +71,43 @@ class DraftSettlementTool(BaseTool):
         additional_terms = arguments.get("additional_terms", "")
 
         try:
-            from src.db.session import async_session_factory
-            from src.db.models.dispute import Dispute
-            from src.db.models.settlement import SettlementAgreement, SettlementStatus
-            from sqlalchemy import select
-
+            # Read the fields the prompt needs, then release the connection
+            # before the LLM call rather than holding it for its duration
+            async with async_session_factory() as db:
+                row = (await db.execute(
+                    select(
+                        Dispute.case_number,
+                        Dispute.respondent_name,
+                        Dispute.claimed_amount,
+                    ).where(Dispute.id == dispute_id)
+                )).first()
+            if not row:
+                return {"error": f"Dispute {dispute_id} not found"}
+
+            # Generate with LLM
+            llm = get_llm_client()
+
+            prompt = _SETTLEMENT_PROMPT(
+                case_number=row.case_number,
+                respondent=row.respondent_name,
+                claimed=(
+                    f"INR {row.claimed_amount:,.2f}"
+                    if row.claimed_amount else "Not specified"
+                ),
+                settlement_amount=settlement_amount,
+                payment_terms=payment_terms,
+                additional=f"Additional Terms: {additional_terms}" if additional_terms else "",
+            )
+
+            response = await llm.chat_completion(
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.3,
+            )
+
+            content_md = response.content or "Settlement agreement generation failed."
+
+            # Save settlement
             async with async_session_factory() as db:
-                result = await db.execute(
-                    select(Dispute).where(Dispute.id == dispute_id)
-                )
-                dispute = result.scalar_one_or_none()
-                if not dispute:
-                    return {"error": f"Dispute {dispute_id} not found"}
-
-                # Generate with LLM
-                from src.llm import get_llm_client
-                llm = get_llm_client()
-
-                prompt = f"""Draft a formal settlement agreement in markdown for this MSME dispute:
-
-Case Number: {dispute.case_number}
-Claimant: (from case records)
-Respondent: {dispute.respondent_name}
-Original Claim: {f'INR {dispute.claimed_amount:,.2f}' if dispute.claimed_amount else 'Not specified'}
-Settlement Amount: INR {settlement_amount:,.2f}
-Payment Terms: {payment_terms}
-{f'Additional Terms: {additional_terms}' if additional_terms else ''}
-
-Generate a professional settlement agreement markdown with:
-1. Title and case reference
-2. Parties section
-3. Recitals (background of dispute)
-4. Settlement terms (amount, payment schedule)
-5. Release and discharge clause
-6. Confidentiality clause
-7. Governing law (MSMED Act 2006)
-8. Signature blocks"""
-
-                response = await llm.chat_completion(
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.3,
-                )
-
-                content_md = response.content or "Settlement agreement generation failed."
-
-                # Save settlement
                 settlement = SettlementAgreement(
                     dispute_id=dispute_id,
                     content_markdown=content_md,
@@ -101,13 +120,13 @@ Generate a professional settlement agreement markdown with:
                 await db.commit()
                 await db.refresh(settlement)
 
-                return {
-                    "dispute_id": dispute_id,
-                    "settlement_id": str(settlement.id),
-                    "settlement_amount": settlement_amount,
-                    "status": "draft",
-                    "content_markdown": content_md,
-                }
+            return {
+                "dispute_id": dispute_id,
+                "settlement_id": str(settlement.id),
+                "settlement_amount": settlement_amount,
+                "status": "draft",
+                "content_markdown": content_md,
+            }
 
         except Exception as e:
             log.error(f"Settlement drafting failed: {e}")
@@ -1,11 +1,19 @@
 """Finalize settlement tool — both parties agreed; draft and deliver to both."""
 
 import asyncio
+import uuid
 from typing import Any
 
+from sqlalchemy import select
+
 from src.tools.base import BaseTool
 from src.core.logging import log
 from src.tools.core.lookup_cases import _norm_mobile
+from src.db.session import async_session_factory
+from src.db.models.dispute import Dispute, DisputeStatus
+from src.db.models.settlement import SettlementAgreement, SettlementStatus
+from src.db.models.user import User
+from src.tools.core.draft_settlement import DraftSettlementTool
 
 
 class FinalizeSettlementTool(BaseTool):
@@ -44,16 +52,6 @@ class FinalizeSettlementTool(BaseTool):
     }
 
     async def execute(self, arguments: dict[str, Any], context: dict[str, Any]) -> dict:
-        import uuid
-
-        from sqlalchemy import select
-
-        from src.db.session import async_session_factory
-        from src.db.models.dispute import Dispute, DisputeStatus
-        from src.db.models.settlement import SettlementAgreement, SettlementStatus
-        from src.db.models.user import User
-        from src.tools.core.draft_settlement import DraftSettlementTool
-
         dispute_id = arguments["dispute_id"]
         amount = float(arguments["settlement_amount"])
         payment_terms = arguments.get("payment_terms", "lump sum within 30 days")
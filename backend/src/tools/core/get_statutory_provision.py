@@ -1,6 +1,7 @@
 """Get statutory provision tool — MSMED Act section lookup."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -11,14 +12,88 @@ from src.tools.base import BaseTool
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 
 
+@lru_cache(maxsize=1)
 def _load_msmed_sections() -> dict:
-    """Load MSMED Act sections from static JSON."""
+    """Load MSMED Act sections from static JSON (read once per process)."""
     filepath = DATA_DIR / "msmed_act_2006.json"
     if filepath.exists():
         return json.loads(filepath.read_text(encoding="utf-8"))
     return {}
 
 
+def _matches(query: str, title_lc: str, content_lc: str, keywords_lc: tuple[str, ...]) -> bool:
+    """Substring match of a lowercased query against one section."""
+    return (
+        query in title_lc
+        or query in content_lc
+        or any(query in kw for kw in keywords_lc)
+    )
+
+
+@lru_cache(maxsize=1)
+def _search_index() -> tuple[tuple, dict[str, tuple[str, ...]]]:
+    """Lowercased section text plus precomputed results for common queries.
+
+    Returns ``(lowered, keyword_index)``: ``lowered`` holds
+    ``(sec_num, title_lc, content_lc, keywords_lc)`` per section, and
+    ``keyword_index`` maps every keyword and title word to the section
+    numbers a full scan for it would return.
+    """
+    lowered = tuple(
+        (
+            sec_num,
+            sec_data.get("title", "").lower(),
+            sec_data.get("content", "").lower(),
+            tuple(kw.lower() for kw in sec_data.get("keywords", [])),
+        )
+        for sec_num, sec_data in _load_msmed_sections().items()
+    )
+
+    tokens = set()
+    for _, title_lc, _, keywords_lc in lowered:
+        tokens.update(keywords_lc)
+        tokens.update(title_lc.split())
+
+    keyword_index = {
+        token: tuple(sec_num for sec_num, *text in lowered if _matches(token, *text))
+        for token in tokens
+    }
+    return lowered, keyword_index
+
+
+@lru_cache(maxsize=256)
+def _lookup(query: str) -> dict:
+    """Resolve a normalized query to its tool result.
+
+    The section data is static for the life of the process, so results
+    are memoized without expiry. The returned dict is shared between
+    calls and must not be mutated.
+    """
+    sections = _load_msmed_sections()
+
+    if not sections:
+        return {"error": "MSMED Act data not loaded. Please search the knowledge base instead."}
+
+    # Direct section number lookup
+    if query in sections:
+        return {"section": query, **sections[query]}
+
+    # Keyword search across sections — precomputed for known keywords
+    lowered, keyword_index = _search_index()
+    matched = keyword_index.get(query)
+    if matched is None:
+        matched = [sec_num for sec_num, *text in lowered if _matches(query, *text)]
+    results = [{"section": sec_num, **sections[sec_num]} for sec_num in matched]
+
+    if results:
+        return {"query": query, "results": results}
+
+    return {
+        "query": query,
+        "message": f"No section found for '{query}'. Try section numbers (15, 16, 18) or keywords (interest, liability, msefc).",
+    }
+
+
 class GetStatutoryProvisionTool(BaseTool):
     """Look up MSMED Act 2006 sections and provisions."""
 
@@ -39,34 +114,4 @@ class GetStatutoryProvisionTool(BaseTool):
     }
 
     async def execute(self, arguments: dict[str, Any], context: dict[str, Any]) -> dict:
-        query = arguments["section"].lower().strip()
-        sections = _load_msmed_sections()
-
-        if not sections:
-            return {"error": "MSMED Act data not loaded. Please search the knowledge base instead."}
-
-        # Direct section number lookup
-        if query in sections:
-            return {"section": query, **sections[query]}
-
-        # Keyword search across sections
-        results = []
-        for sec_num, sec_data in sections.items():
-            title = sec_data.get("title", "").lower()
-            content = sec_data.get("content", "").lower()
-            keywords = sec_data.get("keywords", [])
-
-            if (
-                query in title
-                or query in content
-                or any(query in kw.lower() for kw in keywords)
-            ):
-                results.append({"section": sec_num, **sec_data})
-
-        if results:
-            return {"query": query, "results": results}
-
-        return {
-            "query": query,
-            "message": f"No section found for '{query}'. Try section numbers (15, 16, 18) or keywords (interest, liability, msefc).",
-        }
+        return _lookup(arguments["section"].lower().strip())
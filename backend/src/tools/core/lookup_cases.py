@@ -2,10 +2,14 @@
 
 from typing import Any
 
-from sqlalchemy import select, or_
+from sqlalchemy import false, or_, select
 
 from src.tools.base import BaseTool
 from src.core.logging import log
+from src.db.session import async_session_factory
+from src.db.models.dispute import Dispute
+from src.db.models.user import User
+from src.agent.context.loader import STATUS_LABELS
 
 
 def _norm_mobile(number: str | None) -> str:
@@ -37,9 +41,6 @@ class LookupCasesTool(BaseTool):
 
     async def execute(self, arguments: dict[str, Any], context: dict[str, Any]) -> Any:
         """Look up disputes by mobile number or case number."""
-        from src.db.session import async_session_factory
-        from src.db.models.dispute import Dispute
-        from src.db.models.user import User
 
         mobile = arguments.get("mobile_number", "").strip()
         case_number = arguments.get("case_number", "").strip()
@@ -47,39 +48,48 @@ class LookupCasesTool(BaseTool):
         if not mobile and not case_number:
             return {"error": "Please provide either a mobile number or case number."}
 
+        # Mobile number with and without the 91 country code
+        variants = set()
+        if mobile:
+            variants.add(mobile)
+            if mobile.startswith("91") and len(mobile) == 12:
+                variants.add(mobile[2:])
+            elif len(mobile) == 10:
+                variants.add(f"91{mobile}")
+
+        # One query: the columns the response needs plus whether the
+        # claimant owns this number — plain rows, no ORM hydration
+        is_claimant = User.mobile_number.in_(variants) if variants else false()
+        stmt = (
+            select(
+                Dispute.case_number,
+                Dispute.title,
+                Dispute.status,
+                Dispute.category,
+                Dispute.claimed_amount,
+                Dispute.respondent_name,
+                Dispute.respondent_mobile,
+                Dispute.created_at,
+                is_claimant.label("filed_by_number"),
+            )
+            .outerjoin(User, User.id == Dispute.claimant_id)
+        )
+
         async with async_session_factory() as db:
             if case_number:
                 # Look up by case number
-                result = await db.execute(
-                    select(Dispute).where(Dispute.case_number == case_number)
-                )
-                disputes = result.scalars().all()
+                stmt = stmt.where(Dispute.case_number == case_number)
             else:
                 # Both directions: cases this number FILED (as claimant) and
                 # cases filed AGAINST this number (as respondent). Respondents
                 # are often not registered users, so match respondent_mobile
                 # directly, with and without the 91 country code.
-                variants = {mobile}
-                if mobile.startswith("91") and len(mobile) == 12:
-                    variants.add(mobile[2:])
-                elif len(mobile) == 10:
-                    variants.add(f"91{mobile}")
-
-                result = await db.execute(
-                    select(User).where(User.mobile_number.in_(variants))
-                )
-                user = result.scalar_one_or_none()
-
-                conditions = [Dispute.respondent_mobile.in_(variants)]
-                if user:
-                    conditions.append(Dispute.claimant_id == user.id)
-
-                result = await db.execute(
-                    select(Dispute)
-                    .where(or_(*conditions))
+                stmt = (
+                    stmt.where(or_(Dispute.respondent_mobile.in_(variants), is_claimant))
                     .order_by(Dispute.created_at.desc())
                 )
-                disputes = result.scalars().all()
+
+            disputes = (await db.execute(stmt)).all()
 
             if not disputes:
                 return {
@@ -88,15 +98,13 @@ class LookupCasesTool(BaseTool):
                     "cases": [],
                 }
 
-            from src.agent.context.loader import STATUS_LABELS
-
             cases = []
             for d in disputes:
                 # Which side of the case is this number on?
                 is_respondent = bool(
                     mobile and d.respondent_mobile
                     and _norm_mobile(d.respondent_mobile) == _norm_mobile(mobile)
-                    and not (user and d.claimant_id == user.id)
+                    and not d.filed_by_number
                 )
                 cases.append({
                     "case_number": d.case_number,
@@ -1,9 +1,82 @@
 """Predict outcome tool — DGP outcome prediction using LLM."""
 
+import asyncio
+import time
 from typing import Any
 
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from src.llm import get_llm_client, parse_json_reply
 from src.tools.base import BaseTool
 from src.core.logging import log
+from src.db.session import async_session_factory
+from src.db.models.dispute import Dispute, DisputeCategory
+from src.rag.qdrant_search import QdrantSearch
+
+_NOT_SPECIFIED = "Not specified"
+
+# Precedent text per dispute category and the monotonic time it was fetched.
+# The search query depends only on the category, so disputes share results.
+_PRECEDENT_TTL = 600.0
+_precedent_cache: dict[str | None, tuple[str, float]] = {}
+
+
+def _precedent_query(category: str | None) -> str:
+    """Knowledge-base query used to find precedents for a category."""
+    return f"delayed payment dispute outcome {category} MSMED Act"
+
+
+# Precedent queries for the known categories, built once at import
+_PRECEDENT_QUERIES = {c.value: _precedent_query(c.value) for c in DisputeCategory}
+
+
+# Prompt templates, bound to str.format once at import
+_CASE_SUMMARY = """
+Case Number: {case_number}
+Category: {category}
+Claimed Amount: {claimed}
+Invoice Amount: {invoice}
+Principal Outstanding: {principal}
+PO Date: {po_date}
+Payment Terms: {payment_terms}
+Interest Start Date: {interest_start}
+Description: {description}
+Goods/Services: {goods_services}
+Documents Uploaded: {doc_count}
+Document Types: {doc_types}
+""".format
+
+_PREDICTION_PROMPT = """You are an ODR legal analysis AI. Analyze this MSME delayed payment dispute and predict the probable outcome.
+
+{case_summary}
+
+{legal_context}
+
+Predict outcome considering:
+1. MSMED Act 2006 provisions (Section 15-18)
+2. Strength of documentation
+3. Category of dispute
+4. Amount and timeline
+
+Respond in JSON:
+{{
+    "probable_outcome": "in_favor_of_claimant / partial_recovery / needs_more_evidence / likely_dismissed",
+    "confidence": 0.X,
+    "likely_recovery_percentage": 0-100,
+    "statutory_interest_applicable": true/false,
+    "estimated_settlement_range": {{"min": 0, "max": 0}},
+    "strengths": ["..."],
+    "weaknesses": ["..."],
+    "recommendations": ["..."],
+    "statutory_basis": "Relevant MSMED Act sections",
+    "reasoning": "Detailed reasoning"
+}}""".format
+
+
+def _inr(amount: float | None) -> str:
+    """Format an amount as INR, or 'Not specified' when it is missing."""
+    return f"INR {amount:,.2f}" if amount else _NOT_SPECIFIED
 
 
 class PredictOutcomeTool(BaseTool):
@@ -30,96 +103,56 @@ class PredictOutcomeTool(BaseTool):
         dispute_id = arguments["dispute_id"]
 
         try:
-            from src.db.session import async_session_factory
-            from src.db.models.dispute import Dispute
-            from src.db.models.document import DisputeDocument
-            from sqlalchemy import select
-
             async with async_session_factory() as db:
+                # Dispute and its documents in one round-trip
                 result = await db.execute(
-                    select(Dispute).where(Dispute.id == dispute_id)
+                    select(Dispute)
+                    .options(joinedload(Dispute.documents))
+                    .where(Dispute.id == dispute_id)
                 )
-                dispute = result.scalar_one_or_none()
+                dispute = result.unique().scalar_one_or_none()
                 if not dispute:
                     return {"error": f"Dispute {dispute_id} not found"}
 
-                # Get documents
-                docs_result = await db.execute(
-                    select(DisputeDocument).where(DisputeDocument.dispute_id == dispute_id)
-                )
-                docs = docs_result.scalars().all()
+                docs = dispute.documents
+
+                # Search knowledge base for precedents while the case summary is built
+                precedent_task = asyncio.create_task(self._search_precedents(dispute.category))
 
                 # Build case summary
-                case_summary = f"""
-Case Number: {dispute.case_number}
-Category: {dispute.category}
-Claimed Amount: {f'INR {dispute.claimed_amount:,.2f}' if dispute.claimed_amount else 'Not specified'}
-Invoice Amount: {f'INR {dispute.invoice_amount:,.2f}' if dispute.invoice_amount else 'Not specified'}
-Principal Outstanding: {f'INR {dispute.principal_amount:,.2f}' if dispute.principal_amount else 'Not specified'}
-PO Date: {dispute.po_date or 'Not specified'}
-Payment Terms: {dispute.payment_terms or 'Not specified'}
-Interest Start Date: {dispute.interest_start_date or 'Not specified'}
-Description: {dispute.description or 'Not specified'}
-Goods/Services: {dispute.goods_services_description or 'Not specified'}
-Documents Uploaded: {len(docs)}
-Document Types: {', '.join(d.doc_type for d in docs) if docs else 'None'}
-"""
-
-                # Search knowledge base for precedents
-                try:
-                    from src.rag.qdrant_search import QdrantSearch
-                    rag_context = QdrantSearch.search(
-                        query=f"delayed payment dispute outcome {dispute.category} MSMED Act",
-                        limit=3,
-                    )
-                    precedent_text = "\n".join(r["content"] for r in rag_context) if rag_context else ""
-                except Exception:
-                    precedent_text = ""
+                case_summary = _CASE_SUMMARY(
+                    case_number=dispute.case_number,
+                    category=dispute.category,
+                    claimed=_inr(dispute.claimed_amount),
+                    invoice=_inr(dispute.invoice_amount),
+                    principal=_inr(dispute.principal_amount),
+                    po_date=dispute.po_date or _NOT_SPECIFIED,
+                    payment_terms=dispute.payment_terms or _NOT_SPECIFIED,
+                    interest_start=dispute.interest_start_date or _NOT_SPECIFIED,
+                    description=dispute.description or _NOT_SPECIFIED,
+                    goods_services=dispute.goods_services_description or _NOT_SPECIFIED,
+                    doc_count=len(docs),
+                    doc_types=', '.join(d.doc_type for d in docs) if docs else 'None',
+                )
+
+                precedent_text = await precedent_task
 
                 # Predict with LLM
-                from src.llm import get_llm_client
                 llm = get_llm_client()
 
-                prompt = f"""You are an ODR legal analysis AI. Analyze this MSME delayed payment dispute and predict the probable outcome.
-
-{case_summary}
-
-{f'Relevant Legal Context:{chr(10)}{precedent_text}' if precedent_text else ''}
-
-Predict outcome considering:
-1. MSMED Act 2006 provisions (Section 15-18)
-2. Strength of documentation
-3. Category of dispute
-4. Amount and timeline
-
-Respond in JSON:
-{{
-    "probable_outcome": "in_favor_of_claimant / partial_recovery / needs_more_evidence / likely_dismissed",
-    "confidence": 0.X,
-    "likely_recovery_percentage": 0-100,
-    "statutory_interest_applicable": true/false,
-    "estimated_settlement_range": {{"min": 0, "max": 0}},
-    "strengths": ["..."],
-    "weaknesses": ["..."],
-    "recommendations": ["..."],
-    "statutory_basis": "Relevant MSMED Act sections",
-    "reasoning": "Detailed reasoning"
-}}"""
+                prompt = _PREDICTION_PROMPT(
+                    case_summary=case_summary,
+                    legal_context=f"Relevant Legal Context:\n{precedent_text}" if precedent_text else "",
+                )
 
                 response = await llm.chat_completion(
                     messages=[{"role": "user", "content": prompt}],
                     temperature=0.3,
                 )
 
-                import json
                 try:
-                    content = response.content or "{}"
-                    if "```json" in content:
-                        content = content.split("```json")[1].split("```")[0]
-                    elif "```" in content:
-                        content = content.split("```")[1].split("```")[0]
-                    prediction = json.loads(content.strip())
-                except (json.JSONDecodeError, IndexError):
+                    prediction = parse_json_reply(response.content)
+                except ValueError:
                     prediction = {"reasoning": response.content, "confidence": 0.5}
 
                 # Save to dispute
@@ -131,3 +164,29 @@ Respond in JSON:
         except Exception as e:
             log.error(f"Outcome prediction failed: {e}")
             return {"error": str(e)}
+
+    async def _search_precedents(self, category: str | None) -> str:
+        """Fetch precedent text from the knowledge base ("" if search fails).
+
+        Results are cached per category for ``_PRECEDENT_TTL`` seconds.
+        Empty results are not cached, since search reports a failure as no
+        hits and the next call should retry.
+        """
+        cached = _precedent_cache.get(category)
+        if cached and time.monotonic() - cached[1] < _PRECEDENT_TTL:
+            return cached[0]
+
+        try:
+            rag_context = await asyncio.to_thread(
+                QdrantSearch.search,
+                query=_PRECEDENT_QUERIES.get(category) or _precedent_query(category),
+                limit=3,
+            )
+        except Exception:
+            return ""
+        if not rag_context:
+            return ""
+
+        precedent_text = "\n".join(r["content"] for r in rag_context)
+        _precedent_cache[category] = (precedent_text, time.monotonic())
+        return precedent_text
@@ -1,10 +1,18 @@
 """Relay settlement offer tool — carry one party's offer to the other's phone."""
 
+import uuid
 from typing import Any
 
+from sqlalchemy import func, select
+
 from src.tools.base import BaseTool
 from src.core.logging import log
 from src.tools.core.lookup_cases import _norm_mobile
+from src.db.session import async_session_factory
+from src.db.models.dispute import Dispute
+from src.db.models.negotiation import NegotiationRound
+from src.db.models.user import User
+from src.tools.core.finalize_settlement import _send_whatsapp
 
 
 class RelaySettlementOfferTool(BaseTool):
@@ -43,16 +51,6 @@ class RelaySettlementOfferTool(BaseTool):
     }
 
     async def execute(self, arguments: dict[str, Any], context: dict[str, Any]) -> dict:
-        import uuid
-
-        from sqlalchemy import func, select
-
-        from src.db.session import async_session_factory
-        from src.db.models.dispute import Dispute
-        from src.db.models.negotiation import NegotiationRound
-        from src.db.models.user import User
-        from src.tools.core.finalize_settlement import _send_whatsapp
-
         dispute_id = arguments["dispute_id"]
         amount = float(arguments["offer_amount"])
         payment_terms = arguments.get("payment_terms")
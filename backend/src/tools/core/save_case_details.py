@@ -1,9 +1,14 @@
 """Save case details tool — progressive persistence of collected case info."""
 
+import uuid
 from typing import Any
 
+from sqlalchemy import select
+
 from src.tools.base import BaseTool
 from src.core.logging import log
+from src.db.session import async_session_factory
+from src.db.models.dispute import Dispute, DisputeStatus
 
 # Dispute columns the agent may fill via collection (only empty fields are
 # written — collected details never overwrite existing data).
@@ -55,13 +60,6 @@ class SaveCaseDetailsTool(BaseTool):
     }
 
     async def execute(self, arguments: dict[str, Any], context: dict[str, Any]) -> dict:
-        import uuid
-
-        from sqlalchemy import select
-
-        from src.db.session import async_session_factory
-        from src.db.models.dispute import Dispute, DisputeStatus
-
         dispute_id = arguments.get("dispute_id", "")
         user_id = context.get("user_id")
 
@@ -1,9 +1,20 @@
 """Search knowledge base tool — RAG search on legal documents and case documents."""
 
+import asyncio
+import heapq
 from typing import Any
 
 from src.tools.base import BaseTool
 from src.core.logging import log
+from src.rag.qdrant_search import QdrantSearch, LEGAL_COLLECTION, CASE_DOCS_COLLECTION
+
+# In-flight searches by (query, collection, limit, dispute_id, score_threshold)
+_inflight: dict[tuple, asyncio.Task] = {}
+
+
+def _hit_score(pair: tuple[str, dict]) -> float:
+    """Score of a (collection, hit) pair."""
+    return pair[1]["score"]
 
 
 class SearchKnowledgeTool(BaseTool):
@@ -32,6 +43,10 @@ class SearchKnowledgeTool(BaseTool):
                 "type": "integer",
                 "description": "Max results to return (default 5)",
             },
+            "score_threshold": {
+                "type": "number",
+                "description": "Minimum relevance score (0-1) for a result; raise it to drop weak matches",
+            },
         },
         "required": ["query"],
     }
@@ -40,61 +55,125 @@ class SearchKnowledgeTool(BaseTool):
         query = arguments["query"]
         limit = arguments.get("limit", 5)
         collection = arguments.get("collection", "legal")
+        # Qdrant drops hits below the threshold before sending their payload
+        thresholds = (
+            {"score_threshold": arguments["score_threshold"]}
+            if arguments.get("score_threshold") is not None else {}
+        )
+        dispute_id = context.get("dispute_id")
 
-        try:
-            from src.rag.qdrant_search import QdrantSearch, LEGAL_COLLECTION, CASE_DOCS_COLLECTION
+        # Identical searches already in flight (concurrent sessions asking the
+        # same thing) share one embedding + Qdrant round-trip
+        key = (query, collection, limit, dispute_id, arguments.get("score_threshold"))
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._search(query, collection, limit, dispute_id, thresholds)
+            )
+            _inflight[key] = task
+            task.add_done_callback(lambda _: _inflight.pop(key, None))
+        # Shielded so one caller's cancellation does not cancel the others
+        return await asyncio.shield(task)
 
-            all_results = []
+    async def _search(
+        self,
+        query: str,
+        collection: str,
+        limit: int,
+        dispute_id: str | None,
+        thresholds: dict[str, Any],
+    ) -> dict:
+        """Run the search for one set of arguments and build the tool result."""
+        try:
+            searches: dict[str, dict[str, Any]] = {}
 
             # Search legal collection
             if collection in ("legal", "both"):
-                legal_results = QdrantSearch.search(
-                    query=query,
-                    collection_name=LEGAL_COLLECTION,
-                    limit=limit,
-                )
-                for r in legal_results:
-                    r["collection"] = "legal"
-                all_results.extend(legal_results)
+                searches["legal"] = {"collection_name": LEGAL_COLLECTION}
 
             # Search case docs collection (if dispute context exists)
             if collection in ("case_docs", "both"):
-                dispute_id = context.get("dispute_id")
-                filters = {"dispute_id": dispute_id} if dispute_id else None
-
-                case_results = QdrantSearch.search(
-                    query=query,
-                    collection_name=CASE_DOCS_COLLECTION,
-                    limit=limit,
-                    filters=filters,
+                searches["case_docs"] = {
+                    "collection_name": CASE_DOCS_COLLECTION,
+                    "filters": {"dispute_id": dispute_id} if dispute_id else None,
+                }
+
+            if len(searches) == 1:
+                # Single collection: Qdrant already returns its top hits in
+                # score order, so there is nothing to embed up front or merge
+                [(name, kwargs)] = searches.items()
+                results = await asyncio.to_thread(
+                    QdrantSearch.search, query=query, limit=limit, **thresholds, **kwargs,
                 )
-                for r in case_results:
-                    r["collection"] = "case_docs"
-                all_results.extend(case_results)
+                top = [(name, r) for r in results]
+            else:
+                top = await self._search_merged(query, limit, searches, thresholds)
 
-            if not all_results:
+            if not top:
                 return {
-                    "query": query,
                     "results": [],
                     "message": "No relevant documents found in the knowledge base.",
                 }
 
-            # Sort by score and limit
-            all_results.sort(key=lambda r: r["score"], reverse=True)
-            all_results = all_results[:limit]
-
             return {
-                "query": query,
                 "results": [
                     {
                         "content": r["content"],
                         "score": r["score"],
                         "source": r.get("source", ""),
-                        "collection": r.get("collection", "legal"),
+                        "collection": name,
                     }
-                    for r in all_results
+                    for name, r in top
                 ],
             }
         except Exception as e:
             log.error(f"Knowledge search failed: {e}")
-            return {"query": query, "error": str(e)}
+            return {"error": str(e)}
+
+    @staticmethod
+    async def _search_merged(
+        query: str,
+        limit: int,
+        searches: dict[str, dict[str, Any]],
+        thresholds: dict[str, Any],
+    ) -> list[tuple[str, dict]]:
+        """Search several collections concurrently; top ``limit`` (collection, hit) pairs."""
+        if not searches:
+            return []
+
+        # Embed once; every collection is searched with the same vector
+        query_vector = await asyncio.to_thread(QdrantSearch.embed_query, query)
+
+        # The client is synchronous — run the searches side by side in threads.
+        # One collection failing (e.g. case docs never indexed) must not blank
+        # out the other's hits, so exceptions come back as results.
+        result_lists = await asyncio.gather(*(
+            asyncio.to_thread(
+                QdrantSearch.search,
+                query=query,
+                limit=limit,
+                query_vector=query_vector,
+                raise_errors=True,
+                **thresholds,
+                **kwargs,
+            )
+            for kwargs in searches.values()
+        ), return_exceptions=True)
+
+        succeeded = []
+        for name, results in zip(searches, result_lists):
+            if isinstance(results, Exception):
+                log.warning(f"Knowledge search in {name} failed: {results}")
+            else:
+                succeeded.append((name, results))
+        if not succeeded:
+            raise result_lists[0]
+
+        # (collection, hit) pairs streamed straight into the top-K selection,
+        # with no merged list in between
+        tagged = (
+            (name, r)
+            for name, results in succeeded
+            for r in results
+        )
+        return heapq.nlargest(limit, tagged, key=_hit_score)
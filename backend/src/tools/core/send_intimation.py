@@ -1,9 +1,15 @@
 """Send intimation tool — dispatch the Section 18 notice to the buyer."""
 
+import uuid
 from typing import Any
 
+from sqlalchemy import select
+
 from src.tools.base import BaseTool
 from src.core.logging import log
+from src.db.session import async_session_factory
+from src.db.models.dispute import Dispute
+from src.tasks.dispatcher import dispatch_buyer_and_seller_intimation
 
 
 class SendIntimationTool(BaseTool):
@@ -30,14 +36,6 @@ class SendIntimationTool(BaseTool):
     }
 
     async def execute(self, arguments: dict[str, Any], context: dict[str, Any]) -> dict:
-        import uuid
-
-        from sqlalchemy import select
-
-        from src.db.session import async_session_factory
-        from src.db.models.dispute import Dispute
-        from src.tasks.dispatcher import dispatch_buyer_and_seller_intimation
-
         dispute_id = arguments.get("dispute_id", "")
         user_id = context.get("user_id")
 
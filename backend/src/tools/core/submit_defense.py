@@ -1,11 +1,18 @@
 """Submit defense tool — the respondent's Statement of Defense (ODR Step 4)."""
 
 import asyncio
+import uuid
+from datetime import datetime, timezone
 from typing import Any
 
+from sqlalchemy import select
+
 from src.tools.base import BaseTool
 from src.core.logging import log
 from src.tools.core.lookup_cases import _norm_mobile
+from src.db.session import async_session_factory
+from src.db.models.dispute import Dispute, DisputeStatus
+from src.db.models.user import User
 
 
 class SubmitDefenseTool(BaseTool):
@@ -45,15 +52,6 @@ class SubmitDefenseTool(BaseTool):
     }
 
     async def execute(self, arguments: dict[str, Any], context: dict[str, Any]) -> dict:
-        import uuid
-        from datetime import datetime, timezone
-
-        from sqlalchemy import select
-
-        from src.db.session import async_session_factory
-        from src.db.models.dispute import Dispute, DisputeStatus
-        from src.db.models.user import User
-
         dispute_id = arguments.get("dispute_id", "")
         user_id = context.get("user_id")
 
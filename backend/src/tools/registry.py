@@ -7,14 +7,51 @@ from src.core.logging import log
 from src.tools.base import BaseTool
 from src.tools.core import CORE_TOOLS
 
+# Tool classes per skill slug, {} for skills without a tools module
+_skill_tools_cache: dict[str, dict[str, type[BaseTool]]] = {}
+
+
+def _skill_tools(skill_slug: str) -> dict[str, type[BaseTool]]:
+    """Import a skill's tools module once per process ({} if it has none).
+
+    A missing module is cached as {} too: failed imports are not kept in
+    sys.modules, so without that every agent for a tool-less skill would
+    search the filesystem again. A module that exists but fails to import
+    is not cached, so it is retried.
+    """
+    if (tools := _skill_tools_cache.get(skill_slug)) is not None:
+        return tools
+
+    module_name = f"src.skills.builtin.{skill_slug}.tools"
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if e.name is None or not module_name.startswith(e.name):
+            log.warning(f"Error loading tools for skill {skill_slug}: {e}")
+            return {}
+        log.debug(f"No tools module for skill: {skill_slug}")
+        tools = {}
+    except Exception as e:
+        log.warning(f"Error loading tools for skill {skill_slug}: {e}")
+        return {}
+    else:
+        tools = dict(getattr(module, "SKILL_TOOLS", {}))
+
+    _skill_tools_cache[skill_slug] = tools
+    return tools
+
 
 class ToolRegistry:
     """Registry for managing agent tools."""
 
     def __init__(self):
         self.enabled_tools: set[str] = set()
+        # Enabled names in the order they were enabled, for stable iteration
+        self._enabled_order: tuple[str, ...] = ()
         self._tool_instances: dict[str, BaseTool] = {}
         self._tool_classes: dict[str, type[BaseTool]] = {}
+        # Definitions of the enabled tools; reset whenever that set changes
+        self._definitions: list[dict[str, Any]] | None = None
 
         self._tool_classes.update(CORE_TOOLS)
 
@@ -22,21 +59,12 @@ class ToolRegistry:
         """Load tools from a skill's tools folder."""
         loaded_tools = []
 
-        try:
-            module_path = f"src.skills.builtin.{skill_slug}.tools"
-            module = importlib.import_module(module_path)
-            skill_tools = getattr(module, "SKILL_TOOLS", {})
-
-            for tool_name, tool_class in skill_tools.items():
-                if tool_name not in self._tool_classes:
-                    self._tool_classes[tool_name] = tool_class
-                    loaded_tools.append(tool_name)
-                    log.debug(f"Loaded skill tool: {tool_name} from {skill_slug}")
-
-        except ImportError:
-            log.debug(f"No tools module for skill: {skill_slug}")
-        except Exception as e:
-            log.warning(f"Error loading tools for skill {skill_slug}: {e}")
+        for tool_name, tool_class in _skill_tools(skill_slug).items():
+            if tool_name not in self._tool_classes:
+                self._tool_classes[tool_name] = tool_class
+                loaded_tools.append(tool_name)
+                self._definitions = None
+                log.debug(f"Loaded skill tool: {tool_name} from {skill_slug}")
 
         return loaded_tools
 
@@ -56,31 +84,41 @@ class ToolRegistry:
         if name not in self._tool_classes:
             log.warning(f"Unknown tool: {name}")
             return False
-        self.enabled_tools.add(name)
+        if name not in self.enabled_tools:
+            self.enabled_tools.add(name)
+            self._enabled_order += (name,)
+            self._definitions = None
         return True
 
     def get_tool(self, name: str) -> BaseTool | None:
         """Get a tool instance by name."""
         if name not in self.enabled_tools:
             return None
-        if name not in self._tool_instances:
-            tool_class = self._tool_classes.get(name)
-            if tool_class:
-                self._tool_instances[name] = tool_class()
-        return self._tool_instances.get(name)
+        if (tool := self._tool_instances.get(name)) is not None:
+            return tool
+        tool_class = self._tool_classes.get(name)
+        if tool_class is None:
+            return None
+        tool = self._tool_instances[name] = tool_class()
+        return tool
 
     def get_tool_definitions(self) -> list[dict[str, Any]]:
-        """Get definitions for all enabled tools (for LLM)."""
-        definitions = []
-        for name in self.enabled_tools:
-            tool = self.get_tool(name)
-            if tool:
-                definitions.append(tool.get_definition())
-        return definitions
+        """Get definitions for all enabled tools (for LLM).
+
+        Built once per change to the enabled set rather than on every LLM turn.
+        """
+        if self._definitions is None:
+            definitions = []
+            for name in self._enabled_order:
+                tool = self.get_tool(name)
+                if tool:
+                    definitions.append(tool.get_definition())
+            self._definitions = definitions
+        return list(self._definitions)
 
     def get_enabled_tools(self) -> list[str]:
         """Get list of currently enabled tool names."""
-        return list(self.enabled_tools)
+        return list(self._enabled_order)
 
     async def execute_tool(
         self,
@@ -92,5 +130,6 @@ class ToolRegistry:
         tool = self.get_tool(name)
         if not tool:
             raise ValueError(f"Tool not found or not enabled: {name}")
-        log.info(f"Executing tool: {name}")
+        # The agent already logs each call with its arguments at INFO
+        log.debug(f"Executing tool: {name}")
         return await tool.execute(arguments, context)
@@ -465,6 +465,7 @@ export default function FileCasePage() {
               transcript
             );
             toast.success("Case saved! Redirecting...");
+            api.ackFilingShown(result.dispute_id).catch(() => {});
             router.push(`/disputes/${result.dispute_id}`);
           } catch {
             toast.error("Could not save case. Please try again.");
@@ -694,13 +695,14 @@ export default function FileCasePage() {
 
       api
         .handoffToWhatsApp(handoffFields, sessionId, transcript)
-        .then(() =>
+        .then((result) => {
           toast.success(
             fields.seller_mobile
               ? "Details saved! Check WhatsApp for remaining questions."
               : "Partial details saved under My Cases."
-          )
-        )
+          );
+          api.ackFilingShown(result.dispute_id).catch(() => {});
+        })
         .catch(() => toast.error("Could not save partial details."));
     }
 
@@ -790,6 +792,7 @@ export default function FileCasePage() {
         sessionId
       );
       toast.success("Case filed! Check WhatsApp for next steps.");
+      api.ackFilingShown(result.dispute_id).catch(() => {});
       router.push(`/disputes/${result.dispute_id}`);
     } catch (err: unknown) {
       toast.error(err instanceof Error ? err.message : "Failed to file case");
@@ -135,6 +135,13 @@ export function updateDispute(id: string, data: Record<string, unknown>) {
   });
 }
 
+// Lets the pending WhatsApp dispatches go once the filing success is on screen
+export function ackFilingShown(id: string) {
+  return request<{ success: boolean }>(`/disputes/${id}/ui-ack`, {
+    method: "POST",
+  });
+}
+
 // ─── Documents ───────────────────────────────────────
 export interface Document {
   id: string;